@@ -1,5 +1,10 @@
+import gc
+import os
+import json
 import time
 import random
+import struct
+import binascii
 
 from mpos import Activity, DisplayMetrics, InputManager, SharedPreferences
 
@@ -8,6 +13,92 @@ try:
 except ImportError:
     pass  # lv is already available as a global in MicroPython OS
 
+try:
+    from micropython import const
+except ImportError:
+    def const(value):
+        return value
+
+# Hot path logging (every frame, every LVGL log line, every key) is wrapped in `if _LOG_HOT:`.
+# With 0 (release) MicroPython drops those blocks at compile time, set to 1 for debugging.
+_LOG_HOT = const(0)
+
+# Frames slower than this are logged as stalls, press D afterwards to dump the log
+_STALL_MS = const(200)
+
+# Ghost run files: header followed by one signed byte (height delta) per GHOST_STEP pixels flown
+GHOST_MAGIC = b"QBG1"
+GHOST_HEADER = "<4sIh"  # magic, pipe RNG seed, start height
+
+
+class Log:
+    """Leveled logger writing into a preallocated ring buffer.
+
+    Formatting is deferred: only the format string and its arguments are stored,
+    the text is built when an entry is printed. Entries at or above echo_level
+    are printed right away, everything else only shows up in dump().
+    """
+
+    DEBUG = 0
+    INFO = 1
+    WARN = 2
+    ERROR = 3
+    LEVEL_NAMES = ("D", "I", "W", "E")
+
+    def __init__(self, size=64, level=INFO, echo_level=WARN):
+        self.size = size
+        self.level = level
+        self.echo_level = echo_level
+        self.ticks = [0] * size
+        self.levels = [0] * size
+        self.messages = [None] * size
+        self.args = [None] * size
+        self.index = 0
+        self.count = 0  # Number of valid entries (0 to size)
+
+    def log(self, level, msg, args=None, echo=True):
+        """Store an entry; echo=False keeps it in the buffer whatever its level"""
+        if level < self.level:
+            return
+        i = self.index
+        self.ticks[i] = time.ticks_ms()
+        self.levels[i] = level
+        self.messages[i] = msg
+        self.args[i] = args
+        self.index = (i + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        if echo and level >= self.echo_level:
+            print(self.format(i))
+
+    def debug(self, msg, *args):
+        self.log(self.DEBUG, msg, args)
+
+    def info(self, msg, *args):
+        self.log(self.INFO, msg, args)
+
+    def warn(self, msg, *args):
+        self.log(self.WARN, msg, args)
+
+    def error(self, msg, *args):
+        self.log(self.ERROR, msg, args)
+
+    def format(self, i):
+        """Build the text of entry i"""
+        msg = self.messages[i]
+        if self.args[i]:
+            msg = msg % self.args[i]
+        return "%d %s %s" % (self.ticks[i], self.LEVEL_NAMES[self.levels[i]], msg)
+
+    def dump(self):
+        """Print all buffered entries, oldest first"""
+        start = (self.index - self.count) % self.size
+        for n in range(self.count):
+            print(self.format((start + n) % self.size))
+
+
+log = Log()
+
 
 class Pipe:
     """Represents a single pipe obstacle"""
@@ -20,9 +111,342 @@ class Pipe:
         self.passed = False
 
 
+class GhostRecorder:
+    """Records the bird's height as quantized 8 bit deltas, written to a file in small chunks"""
+
+    def __init__(self, path, seed, start_y, chunk_size):
+        self.file = open(path, "wb")
+        self.file.write(struct.pack(GHOST_HEADER, GHOST_MAGIC, seed, start_y))
+        self.buffer = bytearray(chunk_size)
+        self.fill = 0
+        self.y = start_y  # Height as the player will reconstruct it, so rounding errors never add up
+
+    def add(self, y):
+        delta = int(y) - self.y
+        if delta > 127:
+            delta = 127
+        elif delta < -127:
+            delta = -127
+        self.y += delta
+        self.buffer[self.fill] = delta & 0xFF
+        self.fill += 1
+        if self.fill == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        if self.fill:
+            self.file.write(memoryview(self.buffer)[:self.fill])
+            self.fill = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class GhostPlayer:
+    """Streams a run written by GhostRecorder back, one chunk in memory at a time"""
+
+    def __init__(self, path, chunk_size):
+        self.file = open(path, "rb")
+        try:
+            magic, self.seed, self.y = struct.unpack(GHOST_HEADER, self.file.read(struct.calcsize(GHOST_HEADER)))
+        except (ValueError, struct.error):
+            magic = None
+        if magic != GHOST_MAGIC:
+            self.file.close()
+            raise ValueError("not a ghost run")
+        self.buffer = bytearray(chunk_size)
+        self.fill = 0
+        self.pos = 0
+
+    def next(self):
+        """Advance one sample, returns False once the recorded run has ended"""
+        if self.pos == self.fill:
+            self.fill = self.file.readinto(self.buffer) or 0
+            self.pos = 0
+            if not self.fill:
+                return False
+        delta = self.buffer[self.pos]
+        self.pos += 1
+        self.y += delta - 256 if delta > 127 else delta
+        return True
+
+    def close(self):
+        self.file.close()
+
+
+class Rng:
+    """Small xorshift32 generator whose whole state is one integer, so it can be saved and restored"""
+
+    def __init__(self, state=1):
+        self.seed(state)
+
+    def seed(self, state):
+        self.state = (state & 0xFFFFFFFF) or 1  # xorshift gets stuck on 0
+
+    def randint(self, a, b):
+        x = self.state
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.state = x
+        return a + x % (b - a + 1)
+
+
+class StressBird:
+    """A computer flapped bird of the stress mode"""
+
+    def __init__(self, x, y, aim):
+        self.x = x
+        self.y = y
+        self.velocity = 0
+        self.aim = aim  # Offset from the gap center this bird aims for, so the flock doesn't flap in sync
+        self.crashes = 0
+        self.img = None  # Only set on device, headless runs have no widgets
+
+
+class SpriteMask:
+    """Collision bitmask of a sprite: bit x of a row is set where the pixel is opaque.
+
+    Rows are kept in chunks of CHUNK_BITS columns and compared with right shifts
+    only, so no value ever grows past a small int. Wider integers live on the
+    heap on MicroPython and would allocate in every collision check.
+    """
+
+    CHUNK_BITS = 30  # Small ints on 32 bit ports hold 30 bits plus the sign
+    CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+    def __init__(self, rows, width):
+        self.width = width
+        # Opaque bounding box, used as a cheap pre-test before comparing rows
+        self.top = len(rows)
+        self.bottom = 0
+        self.left = width
+        self.right = 0
+        combined = 0
+        for y, row in enumerate(rows):
+            if row:
+                self.top = min(self.top, y)
+                self.bottom = y + 1
+                combined |= row
+        for x in range(width):
+            if combined >> x & 1:
+                self.left = min(self.left, x)
+                self.right = x + 1
+        # (first column, rows of the CHUNK_BITS columns starting there) for the opaque columns
+        self.chunks = []
+        for first in range(self.left, self.right, self.CHUNK_BITS):
+            self.chunks.append((first, [row >> first & self.CHUNK_MASK for row in rows]))
+
+    def hits(self, x, y, other, other_x, other_y):
+        """Check if this mask placed at (x, y) overlaps other placed at (other_x, other_y)"""
+        # Bounding box pre-test
+        if x + self.right <= other_x + other.left or other_x + other.right <= x + self.left:
+            return False
+        top = max(y + self.top, other_y + other.top)
+        bottom = min(y + self.bottom, other_y + other.bottom)
+        # AND only the rows both boxes cover. For chunks a and b whose columns start
+        # d apart, a & (b << d) is non-zero exactly when (a >> d) & b is
+        for row_y in range(top, bottom):
+            for first, rows in self.chunks:
+                row = rows[row_y - y]
+                if not row:
+                    continue
+                for other_first, other_rows in other.chunks:
+                    shift = other_x + other_first - x - first
+                    if shift >= 0:
+                        if shift < self.CHUNK_BITS and row >> shift & other_rows[row_y - other_y]:
+                            return True
+                    elif shift > -self.CHUNK_BITS and other_rows[row_y - other_y] >> -shift & row:
+                        return True
+        return False
+
+
+class MovingAverage:
+    """Moving average over a fixed number of samples, backed by a ring buffer"""
+
+    def __init__(self, samples):
+        self.samples = samples
+        self.buffer = [0.0] * samples
+        self.index = 0
+        self.sum = 0.0
+        self.count = 0  # Number of valid samples (0 to samples)
+
+    def add(self, value):
+        # Subtract the value being overwritten (if buffer is full)
+        if self.count == self.samples:
+            self.sum -= self.buffer[self.index]
+        else:
+            self.count += 1
+        # Add new value
+        self.sum += value
+        self.buffer[self.index] = value
+        # Advance index
+        self.index = (self.index + 1) % self.samples
+        return self.sum / self.count
+
+
+class GCPolicy:
+    """Keeps garbage collections out of gameplay frames and measures the ones that still hit.
+
+    The threshold is only tuned outside flight: a low one between runs, so the
+    collector cleans up in the menu and the game over lockout. In flight the
+    system's own threshold applies (on stock MicroPython none, the collector
+    runs when the heap is full), together with collections at safe points (game
+    start, lockout, pause) this starts every run with as much free heap as possible.
+
+    Collections the collector runs by itself in flight show up as a drop of
+    gc.mem_alloc() between two frames, the longest such frame is run_max.
+    """
+
+    def __init__(self, samples=16, idle_threshold=4096):
+        self.samples = samples
+        self.idle_threshold = idle_threshold  # Bytes allocated between collections while not flying
+        self.pauses = [0] * samples  # Ring buffer of safe point pause durations in microseconds
+        self.index = 0
+        self.count = 0  # Safe point collections recorded so far
+        self.safe_max = 0  # Longest safe point pause of the current (or last) run in microseconds
+        self.run_max = 0  # Longest flight frame with an automatic collection of the current (or last) run in ms
+        self.run_collections = 0  # Automatic collections in flight during the current (or last) run
+        self.last_alloc = 0  # Heap allocated at the last flight frame
+        self.pending = False  # A collection is due at the next safe point
+        self.saved_threshold = None  # The system's threshold, restored when the activity leaves
+
+    def collect(self):
+        """Run a collection now and record how long it took"""
+        start = time.ticks_us()
+        gc.collect()
+        pause = time.ticks_diff(time.ticks_us(), start)
+        self.pauses[self.index] = pause
+        self.index = (self.index + 1) % self.samples
+        self.count += 1
+        if pause > self.safe_max:
+            self.safe_max = pause
+        self.pending = False
+        self.last_alloc = self.mem_alloc()
+        if _LOG_HOT:
+            log.debug("gc: collected in %d us", pause)
+
+    def mem_alloc(self):
+        return gc.mem_alloc() if hasattr(gc, "mem_alloc") else 0
+
+    def flight_frame(self, frame_ms):
+        """Called every flight frame: if the heap shrank since the last one, the collector ran in this frame"""
+        alloc = self.mem_alloc()
+        if alloc < self.last_alloc:
+            self.run_collections += 1
+            if frame_ms > self.run_max:
+                self.run_max = frame_ms
+            if _LOG_HOT:
+                log.debug("gc: automatic collection in a %d ms frame", frame_ms)
+        self.last_alloc = alloc
+
+    def recent(self):
+        """Recorded safe point pause durations in microseconds, oldest first"""
+        ordered = self.pauses[self.index:] + self.pauses[:self.index]
+        return ordered[self.samples - min(self.count, self.samples):]
+
+    def set_threshold(self, threshold):
+        if not hasattr(gc, "threshold"):
+            return
+        if self.saved_threshold is None:
+            self.saved_threshold = gc.threshold()
+        gc.threshold(threshold)
+
+    def start_run(self):
+        """Start a run with a clean heap"""
+        self.safe_max = 0
+        self.run_max = 0
+        self.run_collections = 0
+        self.collect()
+        self.play()
+
+    def play(self):
+        """Fly with the system's own threshold, and watch for collections from the next frame on"""
+        if self.saved_threshold is not None:
+            gc.threshold(self.saved_threshold)
+        self.last_alloc = self.mem_alloc()
+
+    def relax(self):
+        """Collect early and often while nothing time critical happens"""
+        self.set_threshold(self.idle_threshold)
+
+    def stop(self):
+        """Play stopped: relax and schedule a collection for the next safe point"""
+        self.relax()
+        self.pending = True
+
+    def release(self):
+        """Give the system its own threshold back when the activity leaves the foreground"""
+        if self.saved_threshold is not None:
+            gc.threshold(self.saved_threshold)
+            self.saved_threshold = None
+        self.pending = True  # Collect at the first safe point after coming back
+
+    def idle(self):
+        """Called from safe points, collects if a collection is due"""
+        if self.pending:
+            self.collect()
+
+
+class QualityGovernor:
+    """Sheds visual load when frames miss their time budget.
+
+    The level goes from 0 (everything on) up to max_level (most visuals off).
+    It steps up when the smoothed frame time stays above degrade_ms and steps
+    back down when it stays below restore_ms. The gap between both thresholds
+    and the hold times keep it from flickering; the restore hold doubles every
+    time a restored level turns out to be too slow again.
+    """
+
+    def __init__(self, max_level, degrade_ms=24, restore_ms=18, hold_frames=30, restore_frames=120):
+        self.max_level = max_level
+        self.level = 0
+        self.degrade_ms = degrade_ms
+        self.restore_ms = restore_ms
+        self.hold_frames = hold_frames
+        self.restore_frames = restore_frames
+        self.frame_ms_x8 = 0  # Smoothed frame time in 1/8 ms (integers don't allocate on MicroPython)
+        self.over = 0  # Consecutive frames above degrade_ms
+        self.under = 0  # Consecutive frames below restore_ms
+        self.since_restore = restore_frames  # Frames since the level was last lowered (saturating)
+
+    def update(self, delta_ms):
+        """Feed a measured frame time, returns True if the level changed"""
+        if delta_ms > _STALL_MS:
+            return False  # One-off stalls (loading, collections) say nothing about the steady load
+        self.frame_ms_x8 += delta_ms - (self.frame_ms_x8 >> 3)
+        if self.since_restore < self.restore_frames:
+            self.since_restore += 1
+        frame_ms = self.frame_ms_x8 >> 3
+        if frame_ms > self.degrade_ms:
+            self.under = 0
+            self.over += 1
+            if self.over >= self.hold_frames and self.level < self.max_level:
+                if self.since_restore < self.restore_frames:
+                    # The level we just restored is too slow, wait longer next time
+                    self.restore_frames = min(self.restore_frames * 2, 3840)
+                self.level += 1
+                self.over = 0
+                return True
+        elif frame_ms < self.restore_ms:
+            self.over = 0
+            self.under += 1
+            if self.under >= self.restore_frames and self.level > 0:
+                self.level -= 1
+                self.under = 0
+                self.since_restore = 0
+                return True
+        else:
+            self.over = 0
+            self.under = 0
+        return False
+
+
 class QuasiBird(Activity):
     # Asset path
     ASSET_PATH = "M:apps/com.quasikili.quasibird/assets/"
+    ASSET_FILE_PATH = "apps/com.quasikili.quasibird/assets/"  # Same directory for open(), without the LVGL drive letter
 
     # Screen dimensions
     SCREEN_WIDTH = DisplayMetrics.width()
@@ -34,10 +458,9 @@ class QuasiBird(Activity):
     BIRD_X = 60  # Fixed X position
 
     # Bird properties
-    bird_y = 120
-    bird_velocity = 0
+    FLAP_FRAME_MS = 60  # How long each frame of the flap animation is shown
     bird_size = 32
-    bird_overlap = 6 # Only collide when there's enough overlap - real birds also don't die from brushing against something ;-)
+    bird_overlap = 6 # Without collision masks only collide when there's enough overlap - real birds also don't die from brushing against something ;-)
 
     # Pipe properties
     PIPE_IMAGE_HEIGHT = 200
@@ -46,59 +469,156 @@ class QuasiBird(Activity):
     PIPE_GAP_SIZE = 80
     PIPE_MIN_Y = 20
     PIPE_MAX_Y = SCREEN_HEIGHT - 120
-    pipes = []
+    MAX_PIPES = 4  # Maximum number of pipe pairs to display
 
     # Cloud properties (parallax effect)
     CLOUD_SPEED = 30  # pixels per second (slower than pipes for depth)
-    cloud_images = []
-    cloud_positions = []
+    CLOUD_START_POSITIONS = (
+        ( 50, 30),  # Cloud 1: top right
+        ( 180, 60),  # Cloud 2: middle right
+        ( 320, 40),  # Cloud 3: far right
+    )
 
     # Ground properties
     GROUND_HEIGHT = 40
 
-    # Game state
-    score = 0
-    highscore = 0
-    game_over = False
-    game_started = False
-    is_fire_bird = False  # Track if we're using the fire bird
-    show_fps = 0 # 0 means off, 1 means current, 2 means average
-    game_paused = False  # Track if game is paused
-    popup_modal = None  # Reference to popup modal background
-    update_timer = None  # Reference to LVGL timer for frame updates
-    game_over_time = 0 # Time when game over occurred
     ghost_bird_float_velocity = -20 # Pixels per second for ghost bird to float up
+    FPS_AVERAGE_SAMPLES = 20
+    OBJECT_COUNT_MS = 1000  # The object count walks the whole widget tree, so the overlay refreshes it this often
+    HUD_BG_OPA = 180  # Semi-transparent HUD backgrounds
+
+    # Ghost race against the best recorded run
+    DATA_PATH = "data/com.quasikili.quasibird/"
+    GHOST_STEP = 4  # Pixels flown per recorded sample
+    GHOST_CHUNK = 256  # Bytes buffered in memory while recording or playing back
+    GHOST_OPA = 110  # Translucency of the racing ghost
+
+    # Game state snapshot (taken on pause, restored on resume)
+    SNAPSHOT_VERSION = 1
+    SNAPSHOT_HEADER = "<BBHfffIBB"  # version, flags, score, bird_y, bird_velocity, ground_x, rng state, pipe count, cloud count
+    SNAPSHOT_PIPE = "<fhhB"  # x, gap_y, gap_size, passed
+    SNAPSHOT_CLOUD = "<f"  # x
+    SNAPSHOT_FIRE_BIRD = 1  # Flag bits
+    PERSIST_SNAPSHOT = True  # Also store the snapshot in SharedPreferences so a game killed in the background can resume
+    MAX_DELTA_MS = 100  # Longer frames are clamped so the physics never jumps
+
+    # Stress mode: many computer flapped birds in a dense pipe field (S with widgets, H without, or stress_headless.py off device)
+    STRESS_BIRD_COUNTS = (1, 2, 4, 8, 16, 32, 64)  # Bird counts to measure, one after the other
+    STRESS_STEP_MS = 5000  # How long each bird count is measured on device
+    STRESS_HEADLESS_FRAMES = 300  # Simulated frames per bird count without widgets
+    STRESS_HEADLESS_SLICE = 10  # Simulated frames per LVGL frame, so the headless sweep never blocks the loop for long
+    STRESS_PIPE_SPAWN_DISTANCE = 100
+
+    # Quality levels, each one also sheds everything of the levels below it
+    QUALITY_NO_CLOUDS = 1  # Hide the parallax clouds
+    QUALITY_NO_GROUND_SCROLL = 2  # Stop scrolling the ground tiles
+    QUALITY_OPAQUE_HUD = 3  # Draw HUD backgrounds without blending
+    QUALITY_NO_GHOSTS = 4  # Hide the translucent racing ghost and leave the ghost bird where the bird died
+
+    def reset_state(self):
+        """(Re)initialize all per-instance runtime state.
+
+        Nothing mutable may live on the class: the activity is instantiated
+        again on every launch and class-level lists would be shared (and grow)
+        between those instances.
+        """
+        # Bird
+        self.bird_y = 120
+        self.bird_velocity = 0
 
-    # Timing for framerate independence
-    last_time = 0
-
-    # UI Elements
-    screen = None
-    bird_img = None
-    ghost_bird_img = None # New instance variable for the ghost bird
-    pipe_images = []
-    MAX_PIPES = 4  # Maximum number of pipe pairs to display
-    ground_img = None
-    ground_x = 0
-    score_label = None
-    score_bg = None
-    highscore_label = None
-    highscore_bg = None
-    game_over_label = None
-    start_label = None
-    avg_fps = 0
-    last_fps = 0  # To store the latest FPS value
-    fps_label = None
-    fps_bg = None
+        # Game state
+        self.pipes = []
+        self.cloud_positions = []
+        self.score = 0
+        self.highscore = 0
+        self.game_over = False
+        self.game_started = False
+        self.is_fire_bird = False  # Track if we're using the fire bird
+        self.show_fps = 0 # 0 means off, 1 means current, 2 means average, 3 means longest frame hit by a collection in the run, 4 means quality level,
+                          # 5 means decoded image cache, 6 means LVGL object count
+        self.object_count_time = None  # When the object count overlay was last refreshed, None to refresh right away
+        self.game_paused = False  # Track if game is paused
+        self.game_over_time = 0 # Time when game over occurred
+        self.ground_x = 0
+        self.rng = Rng()
+        self.snapshot = None  # Packed game state taken on pause
+        self.snapshot_persisted = False  # Whether SharedPreferences holds a snapshot
+        self.resume_pending = False  # Paused after a resume until the player taps
+        self.ghost_race = False  # Race against the best recorded run (every race flies the best run's pipes)
+        self.ghost_score = 0  # Score of the best recorded run
+        self.ghost_recorder = None
+        self.ghost_player = None
+        self.distance = 0  # Pixels flown in the current run
+        self.next_ghost_sample = 0  # Distance at which the next ghost sample is due
+        self.stress_birds = None  # Birds of a running stress mode, None when not stressing
+        self.stress_step = 0  # Index into STRESS_BIRD_COUNTS
+        self.stress_step_start = 0
+        self.stress_frames = 0
+        self.stress_frame_ms = 0  # Sum of the frame times of the current step
+        self.stress_results = []
+        self.stress_sweep = None  # Running headless sweep (a generator), None when not sweeping
+
+        # Timing for framerate independence
+        self.last_time = 0
+        self.update_timer = None  # Reference to LVGL timer for frame updates
+
+        # FPS statistics
+        self.last_fps = 0  # To store the latest FPS value
+        self.average_fps = 0
+        self.fps_average = MovingAverage(self.FPS_AVERAGE_SAMPLES)
+        self.gc_policy = GCPolicy()
+        self.quality = QualityGovernor(self.QUALITY_NO_GHOSTS)
+
+        # Sprite atlas: one image, sprites are sub-rectangles [x, y, w, h] listed in the manifest
+        self.atlas_src = None
+        self.image_cache_bytes = 0  # Estimated decoded size of all image sources (ARGB8888), from the atlas manifest
+        self.sprites = {}
+        self.animations = {}
+        self.pipe_body = None  # The pipe's rows below its cap, top pipes show them above a flipped cap
+        self.pipe_cap_height = 0
+        self.bird_frames = []  # Frames of the current bird's flap animation
+        self.bird_frame = 0  # Frame the bird image is showing
+        self.flap_time = 0  # Time of the last flap, drives the animation
+
+        # Collision bitmasks (None when the atlas manifest has no masks)
+        self.bird_mask = None
+        self.fire_bird_mask = None
+        self.pipe_mask = None
+        self.top_pipe_mask = None
+
+        # UI Elements
+        self.screen = None
+        self.bird_img = None
+        self.ghost_bird_img = None
+        self.race_ghost_img = None
+        self.pipe_images = []
+        self.cloud_images = []
+        self.ground_img = None
+        self.score_label = None
+        self.score_bg = None
+        self.highscore_label = None
+        self.highscore_bg = None
+        self.game_over_label = None
+        self.start_label = None
+        self.fps_label = None
+        self.fps_bg = None
+        self.ghost_label = None
+        self.ghost_bg = None
+        self.popup_modal = None  # Reference to popup modal background
+        self.helptext = ""
 
     def onCreate(self):
-        print("Quasi Bird starting...")
+        log.info("Quasi Bird starting...")
+        self.reset_state()
 
         # Load highscore from persistent storage
-        print("Loading preferences...")
         prefs = SharedPreferences("com.quasikili.quasibird")
         self.highscore = prefs.get_int("highscore", 0)
-        print(f"Loaded highscore: {self.highscore}")
+        self.ghost_race = bool(prefs.get_int("ghost_race", 0))
+        self.ghost_score = prefs.get_int("ghost_score", 0)
+        log.info("Loaded highscore: %d", self.highscore)
+
+        self.load_atlas()
 
         self.screen = lv.obj()
         self.screen.set_style_bg_color(lv.color_hex(0x87CEEB), lv.PART.MAIN)  # Sky blue
@@ -123,61 +643,38 @@ class QuasiBird(Activity):
         self.ground_img.set_pos(0, self.SCREEN_HEIGHT - self.GROUND_HEIGHT)
 
         # Create clouds for parallax scrolling (behind bird, in front of sky)
-        cloud_start_positions = [
-            ( 50, 30),  # Cloud 1: top right
-            ( 180, 60),  # Cloud 2: middle right
-            ( 320, 40),  # Cloud 3: far right
-        ]
-        for x, y in cloud_start_positions:
-            cloud = lv.image(self.screen)
-            cloud.set_src(f"{self.ASSET_PATH}cloud.png")
+        for x, y in self.CLOUD_START_POSITIONS:
+            cloud = self.create_sprite("cloud")
             cloud.set_pos(x, y)
             self.cloud_images.append(cloud)
             self.cloud_positions.append(x)
 
+        # Create the racing ghost (behind the bird, initially hidden)
+        self.race_ghost_img = self.create_sprite("gray_bird")
+        self.race_ghost_img.set_style_opa(self.GHOST_OPA, lv.PART.MAIN)
+        self.race_ghost_img.add_flag(lv.obj.FLAG.HIDDEN)
+        self.race_ghost_img.set_pos(self.BIRD_X, int(self.bird_y))
+
         # Create bird
-        self.bird_img = lv.image(self.screen)
-        self.bird_img.set_src(f"{self.ASSET_PATH}bird.png")
+        self.bird_frames = self.animations["bird"]
+        self.bird_frame = len(self.bird_frames) - 1  # Resting frame
+        self.bird_img = self.create_sprite("bird_0")
+        self.set_sprite(self.bird_img, self.bird_frames[self.bird_frame])
         self.bird_img.set_pos(self.BIRD_X, int(self.bird_y))
 
         # Create ghost bird (initially hidden)
-        self.ghost_bird_img = lv.image(self.screen)
-        self.ghost_bird_img.set_src(f"{self.ASSET_PATH}gray_bird.png")
+        self.ghost_bird_img = self.create_sprite("gray_bird")
         self.ghost_bird_img.add_flag(lv.obj.FLAG.HIDDEN)
         self.ghost_bird_img.set_pos(self.BIRD_X, int(self.bird_y))
 
         # Create pipe image pool (pre-create all pipe images)
-        for i in range(self.MAX_PIPES):
-            # Top pipe (flipped using style transform)
-            top_pipe = lv.image(self.screen)
-            top_pipe.set_src(f"{self.ASSET_PATH}pipe.png")
-            # transform image object this way to rotate
-            top_pipe.set_rotation(1800)  # 180 degrees * 10
-
-            # Alternative: use style transform rotation for 180 degree flip and pivot
-            # top_pipe.set_style_transform_rotation(1800, lv.PART.MAIN)  # 180 degrees * 10
-             # top_pipe.set_style_transform_pivot_x(20, lv.PART.MAIN)  # Center X (pipe is 40px wide)
-             # top_pipe.set_style_transform_pivot_y(100, lv.PART.MAIN)  # Center Y (pipe is 200px tall)
-
-            # you can also set width to stretch the image
-            # top_pipe.set_width(200)
-            # top_pipe.set_inner_align(lv.image.ALIGN.STRETCH)
-            top_pipe.add_flag(lv.obj.FLAG.HIDDEN)  # Start hidden
-
-            # Bottom pipe
-            bottom_pipe = lv.image(self.screen)
-            bottom_pipe.set_src(f"{self.ASSET_PATH}pipe.png")
-            bottom_pipe.add_flag(lv.obj.FLAG.HIDDEN)  # Start hidden
-
-            self.pipe_images.append(
-                {"top": top_pipe, "bottom": bottom_pipe, "in_use": False}
-            )
+        self.resize_pipe_pool(self.MAX_PIPES)
 
         # Create score display (top right, with frame background)
         self.score_bg = lv.obj(self.screen)
         self.score_bg.set_size(60, 35)
         self.score_bg.set_style_bg_color(lv.color_hex(0x000000), lv.PART.MAIN)  # Black background
-        self.score_bg.set_style_bg_opa(180, lv.PART.MAIN)  # Semi-transparent
+        self.score_bg.set_style_bg_opa(self.HUD_BG_OPA, lv.PART.MAIN)  # Semi-transparent
         self.score_bg.set_style_border_color(lv.color_hex(0xFFFFFF), lv.PART.MAIN)  # White border
         self.score_bg.set_style_border_width(2, lv.PART.MAIN)
         self.score_bg.set_style_radius(8, lv.PART.MAIN)  # Rounded corners
@@ -193,7 +690,7 @@ class QuasiBird(Activity):
         self.highscore_bg = lv.obj(self.screen)
         self.highscore_bg.set_size(60, 35)
         self.highscore_bg.set_style_bg_color(lv.color_hex(0x000000), lv.PART.MAIN)  # Black background
-        self.highscore_bg.set_style_bg_opa(180, lv.PART.MAIN)  # Semi-transparent
+        self.highscore_bg.set_style_bg_opa(self.HUD_BG_OPA, lv.PART.MAIN)  # Semi-transparent
         self.highscore_bg.set_style_border_color(lv.color_hex(0xFFD700), lv.PART.MAIN)  # Gold border
         self.highscore_bg.set_style_border_width(2, lv.PART.MAIN)
         self.highscore_bg.set_style_radius(8, lv.PART.MAIN)  # Rounded corners
@@ -211,7 +708,7 @@ class QuasiBird(Activity):
         self.fps_bg = lv.obj(self.screen)
         self.fps_bg.set_size(55, 20)
         self.fps_bg.set_style_bg_color(lv.color_hex(0x000000), lv.PART.MAIN)  # Black background
-        self.fps_bg.set_style_bg_opa(180, lv.PART.MAIN)  # Semi-transparent
+        self.fps_bg.set_style_bg_opa(self.HUD_BG_OPA, lv.PART.MAIN)  # Semi-transparent
         self.fps_bg.set_style_border_color(lv.color_hex(0xFFFFFF), lv.PART.MAIN)  # White border
         self.fps_bg.set_style_border_width(2, lv.PART.MAIN)
         self.fps_bg.set_style_radius(8, lv.PART.MAIN)  # Rounded corners
@@ -225,12 +722,29 @@ class QuasiBird(Activity):
         self.fps_label.set_style_text_color(lv.color_hex(0x00FF00), lv.PART.MAIN)
         self.fps_label.center()
 
+        # Create ghost race switch (bottom right, only on the start and game over screens)
+        self.ghost_bg = lv.obj(self.screen)
+        self.ghost_bg.set_size(75, 20)
+        self.ghost_bg.set_style_bg_color(lv.color_hex(0x000000), lv.PART.MAIN)  # Black background
+        self.ghost_bg.set_style_bg_opa(self.HUD_BG_OPA, lv.PART.MAIN)  # Semi-transparent
+        self.ghost_bg.set_style_border_color(lv.color_hex(0xFFFFFF), lv.PART.MAIN)  # White border
+        self.ghost_bg.set_style_border_width(2, lv.PART.MAIN)
+        self.ghost_bg.set_style_radius(8, lv.PART.MAIN)  # Rounded corners
+        self.ghost_bg.set_scrollbar_mode(lv.SCROLLBAR_MODE.OFF)  # Disable scrollbar
+        self.ghost_bg.align(lv.ALIGN.BOTTOM_RIGHT, -8, -8)
+        self.ghost_bg.add_flag(lv.obj.FLAG.CLICKABLE)  # Make it clickable
+        self.ghost_bg.add_event_cb(self.on_ghost_tap, lv.EVENT.CLICKED, None)
+        self.ghost_label = lv.label(self.ghost_bg)
+        self.ghost_label.set_style_text_font(lv.font_montserrat_12, lv.PART.MAIN)
+        self.ghost_label.set_style_text_color(lv.color_hex(0xFFFFFF), lv.PART.MAIN)
+        self.update_ghost_switch()
+
         # Create start instruction label
         self.start_label = lv.label(self.screen)
-        helptext = "Tap to start!\n\nTop left to reset high score,\nbottom left to show FPS."
+        self.helptext = "Tap to start!\n\nTop left to reset high score,\nbottom left to show FPS,\nbottom right to race your ghost."
         if InputManager.has_indev_type(lv.INDEV_TYPE.KEYPAD):
-            helptext = "Press A to start!\n\nY to reset high score,\nB to show FPS."
-        self.start_label.set_text(helptext)
+            self.helptext = "Press A to start!\n\nY to reset high score,\nB to show FPS,\nX to race your ghost."
+        self.start_label.set_text(self.helptext)
         self.start_label.set_style_text_font(lv.font_montserrat_20, lv.PART.MAIN)
         self.start_label.set_style_text_color(lv.color_hex(0xFFFFFF), lv.PART.MAIN)
         self.start_label.align(lv.ALIGN.CENTER, 0, 0)
@@ -245,18 +759,80 @@ class QuasiBird(Activity):
         self.game_over_label.add_flag(lv.obj.FLAG.HIDDEN)
 
         self.setContentView(self.screen)
-        print("Quasi Bird created")
+
+        # Continue a game that was killed in the background
+        saved = prefs.get_string("snapshot", "") if self.PERSIST_SNAPSHOT else ""
+        if saved:
+            self.snapshot_persisted = True
+            try:
+                self.restore_snapshot(binascii.unhexlify(saved))
+            except (ValueError, struct.error) as e:
+                log.warn("Discarding saved snapshot: %s", e)
+        log.info("Quasi Bird created: %d objects, ~%d bytes of decoded images",
+                 self.count_objects(self.screen), self.image_cache_bytes)
 
     def onResume(self, screen): # Activity goes foreground
         lv.log_register_print_cb(self.log_callback)
+        if self.snapshot:
+            self.restore_snapshot(self.snapshot)
+            self.snapshot = None
+        # Nothing is flying before the next tap, so let the collector work
+        self.gc_policy.relax()
+        # The timer was stopped while in the background, don't let the first frame see that time
+        self.last_time = time.ticks_ms()
         self.update_timer = lv.timer_create(self.update_frame, 16, None) # max 60 fps = 16ms/frame
 
     def onPause(self, screen): # Activity goes background
+        if self.game_started and not self.game_over:
+            self.snapshot = self.take_snapshot()
+            if self.PERSIST_SNAPSHOT:
+                self.persist_snapshot(self.snapshot)
+        self.stop_updates()
+
+    def stop_updates(self):
+        """Stop the frame timer and the LVGL log hook, without touching the game state"""
         # Delete the timer
         if self.update_timer:
             self.update_timer.delete()
             self.update_timer = None
         lv.log_register_print_cb(None)
+        # Never leave the collector tuned for this game while another app is in the foreground
+        self.gc_policy.release()
+
+    def onDestroy(self, screen): # Activity is finished
+        """Release everything this instance created so a relaunch starts from scratch"""
+        # The framework already paused (and snapshotted) us, this only makes sure nothing runs on
+        self.stop_updates()
+
+        # The popup lives on the top layer, not on our screen, so it has to go explicitly
+        if self.popup_modal:
+            self.popup_modal.delete()
+            self.popup_modal = None
+
+        self.close_ghosts()
+        self.stress_birds = None
+        self.stress_sweep = None
+
+        # Drop all widget and game references; the screen (and its children) is owned by the framework
+        self.pipes.clear()
+        self.pipe_images.clear()
+        self.cloud_images.clear()
+        self.cloud_positions.clear()
+        self.bird_img = None
+        self.ghost_bird_img = None
+        self.race_ghost_img = None
+        self.ground_img = None
+        self.score_label = None
+        self.score_bg = None
+        self.highscore_label = None
+        self.highscore_bg = None
+        self.game_over_label = None
+        self.start_label = None
+        self.fps_label = None
+        self.fps_bg = None
+        self.ghost_label = None
+        self.ghost_bg = None
+        self.screen = None
 
     def on_tap(self, event):
         """Handle tap/click events"""
@@ -275,6 +851,15 @@ class QuasiBird(Activity):
             self.toggle_fps()
 
         # Always handle the tap as a normal game action
+        if self.stress_birds is not None:
+            return  # The stress mode flaps by itself
+        if self.stress_sweep is not None:
+            return  # No game while the headless sweep is measuring
+
+        if self.resume_pending:
+            self.resume_game()
+            return
+
         if self.game_over and (time.ticks_ms() - self.game_over_time) < 2000:
             # Input is disabled for 2 seconds after game over
             return
@@ -287,10 +872,11 @@ class QuasiBird(Activity):
             self.flap()
 
     def toggle_fps(self):
-        """Toggle FPS display between off, current FPS, and average FPS"""
+        """Cycle the overlay through off, FPS, average FPS, GC pause, quality, image memory and object count"""
         self.show_fps += 1
-        if self.show_fps > 2:
+        if self.show_fps > 6:
             self.show_fps = 0
+        self.object_count_time = None
         if self.show_fps > 0:
             self.fps_bg.remove_flag(lv.obj.FLAG.HIDDEN)
         else:
@@ -299,8 +885,14 @@ class QuasiBird(Activity):
     def on_key(self, event):
         """Handle keyboard input"""
         key = event.get_key()
+        if self.stress_birds is not None and key != ord("S") and key != ord("s"):
+            return  # Only S (to stop) does something while stressing
+        if self.stress_sweep is not None and key != ord("B") and key != ord("b") and key != ord("D") and key != ord("d"):
+            return  # Only the overlay and the log dump while the headless sweep is measuring
         if key == lv.KEY.ENTER or key == lv.KEY.UP or key == ord("A") or key == ord("a"):
-            if not self.game_started:
+            if self.resume_pending:
+                self.resume_game()
+            elif not self.game_started:
                 self.start_game()
             elif self.game_over and (time.ticks_ms() - self.game_over_time) >= 2000:
                 self.restart_game()
@@ -310,14 +902,49 @@ class QuasiBird(Activity):
             self.toggle_fps()
         elif key == ord("Y") or key == ord("y"):
             self.on_highscore_tap(event)
+        elif key == ord("X") or key == ord("x"):
+            self.toggle_ghost_race()
+        elif key == ord("S") or key == ord("s"):
+            if self.stress_birds is not None:
+                self.stop_stress()
+            elif self.stress_sweep is None and (not self.game_started or self.game_over):
+                self.start_stress()
+        elif key == ord("H") or key == ord("h"):
+            if self.stress_sweep is None and (not self.game_started or self.game_over):
+                self.stress_sweep = self.stress_headless_sweep([], self.STRESS_BIRD_COUNTS, self.STRESS_HEADLESS_FRAMES)
+        elif key == ord("D") or key == ord("d"):
+            log.dump()
+        elif _LOG_HOT:
+            log.debug("on_key: unhandled key %d", key)
+
+    def toggle_ghost_race(self):
+        """Switch racing against the best run on or off, takes effect with the next run"""
+        self.ghost_race = not self.ghost_race
+        log.info("Ghost race %s", "on" if self.ghost_race else "off")
+        editor = SharedPreferences("com.quasikili.quasibird").edit()
+        editor.put_int("ghost_race", int(self.ghost_race))
+        editor.commit()
+        self.update_ghost_switch()
+
+    def on_ghost_tap(self, event):
+        """Handle tap on the ghost race switch"""
+        self.toggle_ghost_race()
+
+    def update_ghost_switch(self):
+        """Show the ghost race switch with its setting between runs, hide it in flight and stress mode"""
+        self.ghost_label.set_text("Ghost:on" if self.ghost_race else "Ghost:off")
+        self.ghost_label.center()
+        if (not self.game_started or self.game_over) and self.stress_birds is None:
+            self.ghost_bg.remove_flag(lv.obj.FLAG.HIDDEN)
         else:
-            print(f"on_key: unhandled key {key}")
+            self.ghost_bg.add_flag(lv.obj.FLAG.HIDDEN)
 
     def on_highscore_tap(self, event):
         """Handle tap on highscore label"""
         if self.game_started and not self.game_over:
             # Pause the game
             self.game_paused = True
+            self.gc_policy.stop()
 
         # Show popup asking to delete highscore
         self.show_delete_highscore_popup()
@@ -382,11 +1009,20 @@ class QuasiBird(Activity):
         self.highscore_label.center()
 
         # Save to persistent storage
-        print("Highscore deleted, saving...")
+        log.info("Highscore deleted, saving...")
         editor = SharedPreferences("com.quasikili.quasibird").edit()
         editor.put_int("highscore", 0)
+        editor.put_int("ghost_score", 0)
         editor.commit()
 
+        # The best run goes along with the high score
+        self.ghost_score = 0
+        if self.ghost_player:
+            self.ghost_player.close()
+            self.ghost_player = None
+            self.race_ghost_img.add_flag(lv.obj.FLAG.HIDDEN)
+        self.remove_file(f"{self.DATA_PATH}ghost_best.bin")
+
         # Close popup and unpause
         self.close_popup()
 
@@ -407,8 +1043,11 @@ class QuasiBird(Activity):
         if focusgroup:
             InputManager.emulate_focus_obj(focusgroup, self.screen)
 
-        # Unpause game
-        self.game_paused = False
+        # Unpause game, unless it is a restored game still waiting for its "Tap to continue!"
+        if not self.resume_pending:
+            self.game_paused = False
+            if self.game_started and not self.game_over:
+                self.gc_policy.play()
 
         # Reset last_time to avoid large delta after unpause
         self.last_time = time.ticks_ms()
@@ -418,6 +1057,7 @@ class QuasiBird(Activity):
         self.game_started = True
         self.game_over = False
         self.game_paused = False
+        self.update_ghost_switch()
         self.score = 0
         self.is_fire_bird = False  # Reset to normal bird
         self.game_over_time = 0 # Reset game over time
@@ -426,13 +1066,35 @@ class QuasiBird(Activity):
         self.ghost_bird_img.add_flag(lv.obj.FLAG.HIDDEN)
         # Show normal bird sprite
         self.bird_img.remove_flag(lv.obj.FLAG.HIDDEN)
-        self.bird_img.set_src(f"{self.ASSET_PATH}bird.png")
+        self.bird_frames = self.animations["bird"]
+        self.bird_frame = len(self.bird_frames) - 1
+        self.set_sprite(self.bird_img, self.bird_frames[self.bird_frame])
 
         self.score_label.set_text(str(self.score))
         self.bird_y = self.SCREEN_HEIGHT / 2
         self.bird_velocity = 0
         self.pipes = []
-        self.last_time = time.ticks_ms()
+
+        # Race the best run: same pipes (same seed), recorded trajectory streamed from storage
+        self.close_ghosts()
+        if self.ghost_race and self.ghost_score > 0:
+            try:
+                self.ghost_player = GhostPlayer(f"{self.DATA_PATH}ghost_best.bin", self.GHOST_CHUNK)
+            except OSError:
+                pass  # No best run recorded yet
+            except ValueError as e:
+                log.warn("Ignoring best run: %s", e)
+        self.rng.seed(self.ghost_player.seed if self.ghost_player else random.getrandbits(32))
+        self.apply_quality()  # Shows the racing ghost, unless the quality level sheds it
+
+        # Record this run, it becomes the ghost if it beats the best one
+        self.distance = 0
+        self.next_ghost_sample = 0
+        try:
+            self.make_data_dir()
+            self.ghost_recorder = GhostRecorder(f"{self.DATA_PATH}ghost_run.bin", self.rng.state, int(self.bird_y), self.GHOST_CHUNK)
+        except OSError as e:
+            log.warn("Not recording this run: %s", e)
 
         # Hide start label
         self.start_label.add_flag(lv.obj.FLAG.HIDDEN)
@@ -441,11 +1103,12 @@ class QuasiBird(Activity):
         for pipe_img in self.pipe_images:
             pipe_img["in_use"] = False
             pipe_img["top"].add_flag(lv.obj.FLAG.HIDDEN)
+            pipe_img["top_cap"].add_flag(lv.obj.FLAG.HIDDEN)
             pipe_img["bottom"].add_flag(lv.obj.FLAG.HIDDEN)
 
         # Spawn initial pipes
         for i in range(min(3, self.MAX_PIPES)):
-            gap_y = random.randint(self.PIPE_MIN_Y, self.PIPE_MAX_Y)
+            gap_y = self.rng.randint(self.PIPE_MIN_Y, self.PIPE_MAX_Y)
             pipe = Pipe(
                 self.SCREEN_WIDTH + i * self.PIPE_SPAWN_DISTANCE,
                 gap_y,
@@ -453,6 +1116,10 @@ class QuasiBird(Activity):
             )
             self.pipes.append(pipe)
 
+        # Collect now, before the first frame, instead of somewhere mid-flight
+        self.gc_policy.start_run()
+        self.last_time = time.ticks_ms()
+
     def restart_game(self):
         """Restart after game over"""
         # Hide game over label
@@ -465,10 +1132,221 @@ class QuasiBird(Activity):
         # Start new game
         self.start_game()
 
+    def advance_ghosts(self, delta_time):
+        """Record and play back one ghost sample per GHOST_STEP pixels flown"""
+        self.distance += self.PIPE_SPEED * delta_time
+        # Frame times are clamped, so this runs a small bounded number of times per frame
+        while self.distance >= self.next_ghost_sample:
+            self.next_ghost_sample += self.GHOST_STEP
+            if self.ghost_recorder:
+                self.ghost_recorder.add(self.bird_y)
+            if self.ghost_player:
+                if self.ghost_player.next():
+                    if self.quality.level < self.QUALITY_NO_GHOSTS:
+                        self.race_ghost_img.set_y(self.ghost_player.y)
+                else:
+                    # The best run crashed here
+                    self.ghost_player.close()
+                    self.ghost_player = None
+                    self.race_ghost_img.add_flag(lv.obj.FLAG.HIDDEN)
+
+    def finish_ghost_recording(self):
+        """Keep the run that just ended if it is the new best run"""
+        if not self.ghost_recorder:
+            return
+        self.ghost_recorder.close()
+        self.ghost_recorder = None
+        if self.ghost_player:
+            self.ghost_player.close()
+            self.ghost_player = None
+        run_path = f"{self.DATA_PATH}ghost_run.bin"
+        if self.score > self.ghost_score:
+            best_path = f"{self.DATA_PATH}ghost_best.bin"
+            self.remove_file(best_path)
+            try:
+                os.rename(run_path, best_path)
+            except OSError as e:
+                log.warn("Could not keep best run: %s", e)
+                return
+            self.ghost_score = self.score
+            editor = SharedPreferences("com.quasikili.quasibird").edit()
+            editor.put_int("ghost_score", self.ghost_score)
+            editor.commit()
+        else:
+            self.remove_file(run_path)
+
+    def close_ghosts(self):
+        """Stop recording and playing back without keeping anything"""
+        if self.ghost_recorder:
+            self.ghost_recorder.close()
+            self.ghost_recorder = None
+        if self.ghost_player:
+            self.ghost_player.close()
+            self.ghost_player = None
+
+    def make_data_dir(self):
+        path = ""
+        for part in self.DATA_PATH.rstrip("/").split("/"):
+            path += part
+            try:
+                os.mkdir(path)
+            except OSError:
+                pass  # Already exists
+            path += "/"
+
+    def remove_file(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Nothing to remove
+
+    def take_snapshot(self):
+        """Pack the running game (bird, pipes, clouds, score and RNG) into a few bytes"""
+        header_size = struct.calcsize(self.SNAPSHOT_HEADER)
+        pipe_size = struct.calcsize(self.SNAPSHOT_PIPE)
+        cloud_size = struct.calcsize(self.SNAPSHOT_CLOUD)
+        data = bytearray(header_size + len(self.pipes) * pipe_size + len(self.cloud_positions) * cloud_size)
+        flags = self.SNAPSHOT_FIRE_BIRD if self.is_fire_bird else 0
+        struct.pack_into(self.SNAPSHOT_HEADER, data, 0, self.SNAPSHOT_VERSION, flags, self.score,
+                         self.bird_y, self.bird_velocity, self.ground_x, self.rng.state,
+                         len(self.pipes), len(self.cloud_positions))
+        offset = header_size
+        for pipe in self.pipes:
+            struct.pack_into(self.SNAPSHOT_PIPE, data, offset, pipe.x, pipe.gap_y, pipe.gap_size, pipe.passed)
+            offset += pipe_size
+        for x in self.cloud_positions:
+            struct.pack_into(self.SNAPSHOT_CLOUD, data, offset, x)
+            offset += cloud_size
+        return bytes(data)
+
+    def restore_snapshot(self, data):
+        """Restore a game packed by take_snapshot and wait for a tap to continue it"""
+        header = struct.unpack_from(self.SNAPSHOT_HEADER, data, 0)
+        version, flags, score, bird_y, bird_velocity, ground_x, rng_state, pipe_count, cloud_count = header
+        if version != self.SNAPSHOT_VERSION:
+            log.warn("Ignoring snapshot version %d", version)
+            return False
+
+        # Parse everything before touching the game, so truncated data leaves it as it was
+        offset = struct.calcsize(self.SNAPSHOT_HEADER)
+        pipe_size = struct.calcsize(self.SNAPSHOT_PIPE)
+        cloud_size = struct.calcsize(self.SNAPSHOT_CLOUD)
+        pipes = []
+        for i in range(pipe_count):
+            x, gap_y, gap_size, passed = struct.unpack_from(self.SNAPSHOT_PIPE, data, offset)
+            pipe = Pipe(x, gap_y, gap_size)
+            pipe.passed = bool(passed)
+            pipes.append(pipe)
+            offset += pipe_size
+        clouds = []
+        for i in range(cloud_count):
+            clouds.append(struct.unpack_from(self.SNAPSHOT_CLOUD, data, offset)[0])
+            offset += cloud_size
+
+        self.game_started = True
+        self.game_over = False
+        self.score = score
+        self.is_fire_bird = bool(flags & self.SNAPSHOT_FIRE_BIRD)
+        self.bird_y = bird_y
+        self.bird_velocity = bird_velocity
+        self.ground_x = ground_x
+        self.rng.seed(rng_state)
+        self.pipes = pipes
+        for i in range(min(cloud_count, len(self.cloud_positions))):
+            self.cloud_positions[i] = clouds[i]
+            self.cloud_images[i].set_x(int(clouds[i]))
+
+        # Bring the widgets in line with the restored state
+        self.bird_frames = self.animations["fire_bird" if self.is_fire_bird else "bird"]
+        self.bird_frame = len(self.bird_frames) - 1
+        self.set_sprite(self.bird_img, self.bird_frames[self.bird_frame])
+        self.bird_img.set_y(int(self.bird_y))
+        self.bird_img.remove_flag(lv.obj.FLAG.HIDDEN)
+        self.ghost_bird_img.add_flag(lv.obj.FLAG.HIDDEN)
+        self.game_over_label.add_flag(lv.obj.FLAG.HIDDEN)
+        self.score_label.set_text(str(self.score))
+        self.score_label.center()
+        self.ground_img.set_offset_x(int(self.ground_x))
+        self.update_pipe_images()
+        self.update_ghost_switch()
+
+        if not self.game_paused:
+            self.pause_for_resume()
+        return True
+
+    def persist_snapshot(self, data):
+        """Store (or with empty data, clear) the snapshot in SharedPreferences"""
+        editor = SharedPreferences("com.quasikili.quasibird").edit()
+        editor.put_string("snapshot", binascii.hexlify(data).decode())
+        editor.commit()
+        self.snapshot_persisted = bool(data)
+
+    def pause_for_resume(self):
+        """Hold a restored game until the player is ready"""
+        self.game_paused = True
+        self.resume_pending = True
+        helptext = "Tap to continue!"
+        if InputManager.has_indev_type(lv.INDEV_TYPE.KEYPAD):
+            helptext = "Press A to continue!"
+        self.start_label.set_text(helptext)
+        self.start_label.remove_flag(lv.obj.FLAG.HIDDEN)
+
+    def resume_game(self):
+        """Continue a game held by pause_for_resume"""
+        self.resume_pending = False
+        self.game_paused = False
+        self.start_label.add_flag(lv.obj.FLAG.HIDDEN)
+        self.gc_policy.play()
+        self.last_time = time.ticks_ms()
+
     def flap(self):
         """Make the bird flap"""
         if not self.game_over:
             self.bird_velocity = self.FLAP_VELOCITY
+            self.flap_time = time.ticks_ms()
+            self.animate_bird(self.flap_time)
+
+    def animate_bird(self, current_time):
+        """Play the flap animation once after each flap, then rest on its last frame"""
+        frame = time.ticks_diff(current_time, self.flap_time) // self.FLAP_FRAME_MS
+        if frame >= len(self.bird_frames):
+            frame = len(self.bird_frames) - 1
+        if frame != self.bird_frame:
+            self.bird_frame = frame
+            self.set_sprite(self.bird_img, self.bird_frames[frame])
+
+    def load_atlas(self):
+        """Load the sprite atlas manifest (and collision masks) written by generate_assets.py"""
+        with open(f"{self.ASSET_FILE_PATH}atlas.json") as f:
+            manifest = json.load(f)
+        # All sprite images share this one source, so LVGL decodes and caches the sheet once
+        self.atlas_src = f"{self.ASSET_PATH}{manifest['image']}"
+        self.sprites = manifest["sprites"]
+        self.animations = {}
+        for name, frames in manifest["animations"].items():
+            self.animations[name] = [self.sprites[frame] for frame in frames]
+        # The body rows are all alike, so the atlas holds one pipe and only the top pipe's cap
+        x, y, w, h = self.sprites["pipe"]
+        self.pipe_cap_height = self.sprites["pipe_top_cap"][3]
+        self.pipe_body = [x, y + self.pipe_cap_height, w, h - self.pipe_cap_height]
+        self.load_masks(manifest.get("masks"))
+        # LVGL keeps one decoded copy per source, however many image objects show it
+        self.image_cache_bytes = sum(manifest.get("decoded", {}).values())
+
+    def create_sprite(self, name):
+        """Create an image showing one sprite of the atlas"""
+        img = lv.image(self.screen)
+        img.set_src(self.atlas_src)
+        img.set_inner_align(lv.image.ALIGN.TOP_LEFT)
+        self.set_sprite(img, self.sprites[name])
+        return img
+
+    def set_sprite(self, img, rect):
+        """Show another sub-rectangle of the atlas, without any file lookup"""
+        x, y, w, h = rect
+        img.set_size(w, h)
+        img.set_offset_x(-x)
+        img.set_offset_y(-y)
 
     def update_pipe_images(self):
         """Update pipe image positions and visibility"""
@@ -478,12 +1356,14 @@ class QuasiBird(Activity):
 
         # Map visible pipes to image slots
         for i, pipe in enumerate(self.pipes):
-            if i < self.MAX_PIPES:
+            if i < len(self.pipe_images):
                 pipe_imgs = self.pipe_images[i]
                 pipe_imgs["in_use"] = True
 
                 pipe_imgs["top"].remove_flag(lv.obj.FLAG.HIDDEN)
                 pipe_imgs["top"].set_pos(int(pipe.x), int(pipe.gap_y - self.PIPE_IMAGE_HEIGHT))
+                pipe_imgs["top_cap"].remove_flag(lv.obj.FLAG.HIDDEN)
+                pipe_imgs["top_cap"].set_pos(int(pipe.x), int(pipe.gap_y - self.pipe_cap_height))
 
                 # Show and update bottom pipe
                 pipe_imgs["bottom"].remove_flag(lv.obj.FLAG.HIDDEN)
@@ -493,19 +1373,98 @@ class QuasiBird(Activity):
         for pipe_img in self.pipe_images:
             if not pipe_img["in_use"]:
                 pipe_img["top"].add_flag(lv.obj.FLAG.HIDDEN)
+                pipe_img["top_cap"].add_flag(lv.obj.FLAG.HIDDEN)
                 pipe_img["bottom"].add_flag(lv.obj.FLAG.HIDDEN)
 
+    def resize_pipe_pool(self, count):
+        """Create or delete pipe images until the pool holds count pipes"""
+        while len(self.pipe_images) < count:
+            # Top pipe: the pipe body, with a pre-flipped cap at its end so no rotation transform is needed
+            top_pipe = self.create_sprite("pipe")
+            self.set_sprite(top_pipe, self.pipe_body)
+            top_pipe.add_flag(lv.obj.FLAG.HIDDEN)  # Start hidden
+            top_cap = self.create_sprite("pipe_top_cap")
+            top_cap.add_flag(lv.obj.FLAG.HIDDEN)  # Start hidden
+
+            # Bottom pipe
+            bottom_pipe = self.create_sprite("pipe")
+            bottom_pipe.add_flag(lv.obj.FLAG.HIDDEN)  # Start hidden
+
+            self.pipe_images.append(
+                {"top": top_pipe, "top_cap": top_cap, "bottom": bottom_pipe, "in_use": False}
+            )
+        while len(self.pipe_images) > count:
+            pipe_img = self.pipe_images.pop()
+            pipe_img["top"].delete()
+            pipe_img["top_cap"].delete()
+            pipe_img["bottom"].delete()
+
+    def apply_quality(self):
+        """Show or hide the costly visuals for the current quality level"""
+        level = self.quality.level
+        for cloud_img in self.cloud_images:
+            if level >= self.QUALITY_NO_CLOUDS:
+                cloud_img.add_flag(lv.obj.FLAG.HIDDEN)
+            else:
+                cloud_img.remove_flag(lv.obj.FLAG.HIDDEN)
+
+        hud_opa = lv.OPA.COVER if level >= self.QUALITY_OPAQUE_HUD else self.HUD_BG_OPA
+        for hud_bg in (self.score_bg, self.highscore_bg, self.fps_bg):
+            hud_bg.set_style_bg_opa(hud_opa, lv.PART.MAIN)
+
+        # The racing ghost is blended and moved every frame; the player keeps reading so it can come back in place
+        if level >= self.QUALITY_NO_GHOSTS or not self.ghost_player:
+            self.race_ghost_img.add_flag(lv.obj.FLAG.HIDDEN)
+        else:
+            self.race_ghost_img.set_y(self.ghost_player.y)
+            self.race_ghost_img.remove_flag(lv.obj.FLAG.HIDDEN)
+
+    def load_masks(self, masks):
+        """Set up the collision bitmasks from the atlas manifest"""
+        try:
+            self.bird_mask = SpriteMask(masks["bird"]["rows"], masks["bird"]["width"])
+            self.fire_bird_mask = SpriteMask(masks["fire_bird"]["rows"], masks["fire_bird"]["width"])
+            self.pipe_mask = SpriteMask(masks["pipe"]["rows"], masks["pipe"]["width"])
+            self.top_pipe_mask = SpriteMask(masks["pipe_top"]["rows"], masks["pipe_top"]["width"])
+        except (TypeError, KeyError) as e:
+            log.warn("No collision masks, using boxes: %s", e)
+            self.bird_mask = None
+            self.fire_bird_mask = None
+            self.pipe_mask = None
+            self.top_pipe_mask = None
+
     def check_collision(self):
         """Check if bird collides with pipes or boundaries"""
+        bird_mask = self.fire_bird_mask if self.is_fire_bird else self.bird_mask
+        return self.bird_collides(self.BIRD_X, self.bird_y, bird_mask)
+
+    def bird_collides(self, bird_x, bird_y, bird_mask):
+        """Check if a bird at (bird_x, bird_y) collides with pipes or boundaries"""
+        if bird_mask:
+            bird_y = int(bird_y)
+
+            # Check ground and ceiling against the opaque part of the sprite
+            if bird_y + bird_mask.top <= 0 or bird_y + bird_mask.bottom > self.SCREEN_HEIGHT - self.GROUND_HEIGHT:
+                return True
+
+            # Check pipe collision pixel by pixel, at the positions the pipe images are drawn
+            for pipe in self.pipes:
+                pipe_x = int(pipe.x)
+                if bird_mask.hits(bird_x, bird_y, self.top_pipe_mask, pipe_x, int(pipe.gap_y - self.PIPE_IMAGE_HEIGHT)):
+                    return True
+                if bird_mask.hits(bird_x, bird_y, self.pipe_mask, pipe_x, int(pipe.gap_y + pipe.gap_size)):
+                    return True
+            return False
+
         # Check ground and ceiling
-        if self.bird_y <= 0 or self.bird_y >= self.SCREEN_HEIGHT - self.GROUND_HEIGHT - self.bird_size + self.bird_overlap:
+        if bird_y <= 0 or bird_y >= self.SCREEN_HEIGHT - self.GROUND_HEIGHT - self.bird_size + self.bird_overlap:
             return True
 
         # Check pipe collision
-        bird_left = self.BIRD_X + self.bird_overlap
-        bird_right = self.BIRD_X + self.bird_size - self.bird_overlap
-        bird_top = self.bird_y + self.bird_overlap
-        bird_bottom = self.bird_y + self.bird_size - self.bird_overlap
+        bird_left = bird_x + self.bird_overlap
+        bird_right = bird_x + self.bird_size - self.bird_overlap
+        bird_top = bird_y + self.bird_overlap
+        bird_bottom = bird_y + self.bird_size - self.bird_overlap
 
         for pipe in self.pipes:
             pipe_left = pipe.x
@@ -524,43 +1483,83 @@ class QuasiBird(Activity):
 
         current_time = time.ticks_ms()
         delta_ms = time.ticks_diff(current_time, self.last_time)
-        delta_time = delta_ms / 1000.0  # Convert to seconds
         self.last_time = current_time
 
+        if delta_ms > _STALL_MS and self.game_started:
+            log.warn("stall: %d ms frame", delta_ms)
+
+        delta_time = min(delta_ms, self.MAX_DELTA_MS) / 1000.0  # Convert to seconds
+
         if self.show_fps == 1:
             self.fps_label.set_text(f"FPS:{self.last_fps}")
         elif self.show_fps == 2:
             self.fps_label.set_text(f"FPS:{round(self.average_fps)}")
+        elif self.show_fps == 3:
+            self.fps_label.set_text(f"GC:{self.gc_policy.run_max}ms")
+        elif self.show_fps == 4:
+            self.fps_label.set_text(f"Q:{self.quality.level}/{self.quality.max_level}")
+        elif self.show_fps == 5:
+            # An estimate from the image sizes in the manifest, not a reading of the image cache
+            self.fps_label.set_text(f"~IMG:{(self.image_cache_bytes + 512) // 1024}K")
+        elif self.show_fps == 6:
+            if self.object_count_time is None or time.ticks_diff(current_time, self.object_count_time) >= self.OBJECT_COUNT_MS:
+                self.object_count_time = current_time
+                self.fps_label.set_text(f"OBJ:{self.count_objects(self.screen)}")
+
+        if self.stress_birds is not None:
+            self.update_stress(current_time, delta_ms, delta_time)
+            return
+
+        if self.stress_sweep is not None:
+            self.update_stress_sweep()
+
+        if not self.game_started:
+            return
 
-        if not self.game_started or self.game_paused:
+        if self.game_paused:
+            self.gc_policy.idle()
             return
 
         if self.game_over:
+            # The 2 second input lockout is a safe point for the collector
+            if time.ticks_diff(current_time, self.game_over_time) < 2000:
+                self.gc_policy.idle()
             # Make the ghost bird float upwards
-            self.bird_y += self.ghost_bird_float_velocity * delta_time
-            self.ghost_bird_img.set_y(int(self.bird_y))
+            if self.quality.level < self.QUALITY_NO_GHOSTS:
+                self.bird_y += self.ghost_bird_float_velocity * delta_time
+                self.ghost_bird_img.set_y(int(self.bird_y))
             # Check if 2 seconds have passed since game over to update the label
             if self.game_over_time > 0 and (current_time - self.game_over_time) >= 2000:
                 self.game_over_label.set_text("Game Over!\nTap to Restart")
             return
 
+        self.gc_policy.flight_frame(delta_ms)
+
+        # Shed or restore costly visuals depending on how long frames take
+        if self.quality.update(delta_ms):
+            log.info("Quality level %d", self.quality.level)
+            self.apply_quality()
+
         # Update physics
         self.bird_velocity += self.GRAVITY * delta_time
         self.bird_y += self.bird_velocity * delta_time
 
         # Update bird position
         self.bird_img.set_y(int(self.bird_y))
+        self.animate_bird(current_time)
+        self.advance_ghosts(delta_time)
 
         # Update cloud parallax scrolling (slower than pipes for depth)
-        for i, cloud_img in enumerate(self.cloud_images):
-            self.cloud_positions[i] -= self.CLOUD_SPEED * delta_time
+        if self.quality.level < self.QUALITY_NO_CLOUDS:
+            for i, cloud_img in enumerate(self.cloud_images):
+                self.cloud_positions[i] -= self.CLOUD_SPEED * delta_time
 
-            # Wrap cloud when it goes off screen
-            if self.cloud_positions[i] < -60:  # Cloud width is ~50px
-                self.cloud_positions[i] = self.SCREEN_WIDTH + 20
+                # Wrap cloud when it goes off screen
+                if self.cloud_positions[i] < -60:  # Cloud width is ~50px
+                    self.cloud_positions[i] = self.SCREEN_WIDTH + 20
 
-            # Update cloud position
-            cloud_img.set_x(int(self.cloud_positions[i]))
+                # Update cloud position
+                cloud_img.set_x(int(self.cloud_positions[i]))
 
         # Update pipes
         for pipe in self.pipes:
@@ -576,8 +1575,9 @@ class QuasiBird(Activity):
                 # Switch to fire bird when beating highscore!
                 if self.score > self.highscore and not self.is_fire_bird:
                     self.is_fire_bird = True
-                    print("! FIRE BIRD ACTIVATED !")
-                    self.bird_img.set_src(f"{self.ASSET_PATH}fire_bird.png")
+                    log.info("Fire bird activated")
+                    self.bird_frames = self.animations["fire_bird"]
+                    self.set_sprite(self.bird_img, self.bird_frames[self.bird_frame])
 
         # Remove off-screen pipes and spawn new ones
         if self.pipes and self.pipes[0].x < -self.pipes[0].width:
@@ -587,7 +1587,7 @@ class QuasiBird(Activity):
             # Spawn new pipe at the end
             if self.pipes:
                 last_pipe = self.pipes[-1]
-                gap_y = random.randint(self.PIPE_MIN_Y, self.PIPE_MAX_Y)
+                gap_y = self.rng.randint(self.PIPE_MIN_Y, self.PIPE_MAX_Y)
                 new_pipe = Pipe(
                     last_pipe.x + self.PIPE_SPAWN_DISTANCE,
                     gap_y,
@@ -599,14 +1599,20 @@ class QuasiBird(Activity):
         self.update_pipe_images()
 
         # Update ground scrolling (using tiling with offset)
-        self.ground_x -= self.PIPE_SPEED * delta_time
-        # No need to reset - tiling handles wrapping automatically
-        self.ground_img.set_offset_x(int(self.ground_x))
+        if self.quality.level < self.QUALITY_NO_GROUND_SCROLL:
+            self.ground_x -= self.PIPE_SPEED * delta_time
+            # No need to reset - tiling handles wrapping automatically
+            self.ground_img.set_offset_x(int(self.ground_x))
 
         # Check collision
         if self.check_collision():
             self.game_over = True
             self.game_over_time = current_time # Record game over time
+            self.gc_policy.stop()
+            log.info("GC: %d automatic collections in flight, longest frame %d ms, safe point pauses (us): %s",
+                     self.gc_policy.run_collections, self.gc_policy.run_max, self.gc_policy.recent())
+            if self.snapshot_persisted:
+                self.persist_snapshot(b"")
 
             # Hide the original bird
             # self.bird_img.add_flag(lv.obj.FLAG.HIDDEN)
@@ -614,6 +1620,8 @@ class QuasiBird(Activity):
             self.ghost_bird_img.set_pos(self.BIRD_X, int(self.bird_y))
             self.ghost_bird_img.remove_flag(lv.obj.FLAG.HIDDEN)
             self.ghost_bird_img.move_foreground()
+            self.finish_ghost_recording()
+            self.race_ghost_img.add_flag(lv.obj.FLAG.HIDDEN)
 
             # Update highscore if beaten
             if self.score > self.highscore:
@@ -623,7 +1631,7 @@ class QuasiBird(Activity):
                 self.highscore_label.center()
 
                 # Save new highscore to persistent storage
-                print(f"New highscore: {self.highscore}! Saving...")
+                log.info("New highscore: %d! Saving...", self.highscore)
                 editor = SharedPreferences("com.quasikili.quasibird").edit()
                 editor.put_int("highscore", self.highscore)
                 editor.commit()
@@ -631,38 +1639,207 @@ class QuasiBird(Activity):
             # Show "Game Over!" immediately
             self.game_over_label.set_text("Game Over!\n")
             self.game_over_label.remove_flag(lv.obj.FLAG.HIDDEN)
+            self.update_ghost_switch()
+
+    def create_stress_field(self, count):
+        """Spread count birds over the left half of the screen and fill it with a dense pipe field"""
+        birds = []
+        for i in range(count):
+            x = 10 + (i * 37) % (self.SCREEN_WIDTH // 2)
+            birds.append(StressBird(x, self.SCREEN_HEIGHT / 2, self.rng.randint(-15, 15)))
+        pipes = [Pipe(self.SCREEN_WIDTH / 2, self.rng.randint(self.PIPE_MIN_Y, self.PIPE_MAX_Y), self.PIPE_GAP_SIZE)]
+        self.spawn_stress_pipes(pipes)
+        return birds, pipes
+
+    def spawn_stress_pipes(self, pipes):
+        """Add pipes at the right until the field reaches one spawn distance past the screen edge"""
+        while pipes[-1].x < self.SCREEN_WIDTH + self.STRESS_PIPE_SPAWN_DISTANCE:
+            pipes.append(Pipe(pipes[-1].x + self.STRESS_PIPE_SPAWN_DISTANCE,
+                              self.rng.randint(self.PIPE_MIN_Y, self.PIPE_MAX_Y), self.PIPE_GAP_SIZE))
+
+    def stress_pipe_slots(self):
+        """Most pipes a stress field holds at once: they live from -width up to two spawn distances past the screen"""
+        span = self.SCREEN_WIDTH + 2 * self.STRESS_PIPE_SPAWN_DISTANCE + Pipe(0, 0).width
+        return span // self.STRESS_PIPE_SPAWN_DISTANCE + 1
+
+    def step_stress(self, birds, delta_time):
+        """Advance the stress simulation on self.pipes by one frame, without touching any widget"""
+        pipes = self.pipes
+        for pipe in pipes:
+            pipe.x -= self.PIPE_SPEED * delta_time
+        while pipes[0].x < -pipes[0].width:
+            pipes.pop(0)
+        self.spawn_stress_pipes(pipes)
+
+        for bird in birds:
+            bird.velocity += self.GRAVITY * delta_time
+            bird.y += bird.velocity * delta_time
+
+            # Flap when sinking below the middle of the next gap
+            target = self.SCREEN_HEIGHT / 2
+            for pipe in pipes:
+                if pipe.x + pipe.width > bird.x:
+                    target = pipe.gap_y + pipe.gap_size / 2
+                    break
+            if bird.velocity > 0 and bird.y + self.bird_size / 2 > target + bird.aim:
+                bird.velocity = self.FLAP_VELOCITY
+
+            # Crashed birds start over in the gap, so the number of birds stays the same
+            if self.bird_collides(bird.x, bird.y, self.bird_mask):
+                bird.crashes += 1
+                bird.y = target - self.bird_size / 2
+                bird.velocity = 0
+
+    def stress_headless_sweep(self, results, counts, frames):
+        """Time the stress simulation alone (no widgets, no redraw) for growing bird counts.
+
+        Headless means widget-less: this is the game's own simulation and needs
+        the activity, so off device it runs on the stand-ins in tests/stubs
+        (stress_headless.py). As a generator it yields the bird count after
+        every STRESS_HEADLESS_SLICE frames, and update_frame runs one slice per
+        LVGL frame.
+        """
+        for count in counts:
+            birds, pipes = self.create_stress_field(count)
+            gc.collect()
+            frame_us = 0
+            max_pipes = 0
+            for done in range(0, frames, self.STRESS_HEADLESS_SLICE):
+                # step_stress and bird_collides work on self.pipes, lend it the field for this slice
+                saved_pipes = self.pipes
+                self.pipes = pipes
+                start = time.ticks_us()
+                for i in range(min(self.STRESS_HEADLESS_SLICE, frames - done)):
+                    self.step_stress(birds, 0.016)
+                frame_us += time.ticks_diff(time.ticks_us(), start)
+                self.pipes = saved_pipes
+                max_pipes = max(max_pipes, len(pipes))
+                yield count
+            frame_us //= frames
+            crashes = sum(bird.crashes for bird in birds)
+            log.info("Stress headless: %d birds, %d us/frame", count, frame_us)
+            results.append((count, frame_us, max_pipes, crashes))
+        self.print_stress_report("headless", ("birds", "us/frame", "pipes", "crashes"), results)
+
+    def update_stress_sweep(self):
+        """Run one slice of the headless sweep, with its progress on the start label"""
+        try:
+            count = next(self.stress_sweep)
+            self.start_label.set_text(f"Stress (headless)\n{count} birds...")
+        except StopIteration:
+            self.stress_sweep = None
+            self.start_label.set_text(self.helptext)
+
+    def run_stress_headless(self, counts=None, frames=None):
+        """Run the whole headless sweep at once (off device, or from the REPL where it blocks the LVGL loop until done)"""
+        results = []
+        for count in self.stress_headless_sweep(results, counts or self.STRESS_BIRD_COUNTS,
+                                                frames or self.STRESS_HEADLESS_FRAMES):
+            pass
+        return results
+
+    def start_stress(self):
+        """Stress the real update and redraw path with growing numbers of birds on screen"""
+        log.info("Stress mode started")
+        self.close_ghosts()
+        self.game_started = False
+        self.game_over = False
+        for img in (self.start_label, self.game_over_label, self.bird_img, self.ghost_bird_img, self.race_ghost_img):
+            img.add_flag(lv.obj.FLAG.HIDDEN)
+
+        self.stress_birds = []
+        self.stress_results = []
+        self.stress_step = -1
+        self.update_ghost_switch()
+        self.next_stress_step(time.ticks_ms())
+
+    def next_stress_step(self, current_time):
+        """Move on to the next bird count, or finish after the last one"""
+        self.stress_step += 1
+        if self.stress_step >= len(self.STRESS_BIRD_COUNTS):
+            self.stop_stress()
+            return
 
-    average_samples = 20
-    buffer = [0.0] * average_samples
-    index = 0
-    sum = 0.0
-    count = 0  # Number of valid samples (0 to average_samples)
-    def moving_average(self, value):
-        # Subtract the value being overwritten (if buffer is full)
-        if self.count == self.average_samples:
-            self.sum -= self.buffer[self.index]
-        else:
-            self.count += 1
-        # Add new value
-        self.sum += value
-        self.buffer[self.index] = value
-        # Advance index
-        self.index = (self.index + 1) % self.average_samples
-        return self.sum / self.count
+        # Start every step from a fresh field so the counts compare
+        for bird in self.stress_birds:
+            bird.img.delete()
+        self.stress_birds, self.pipes = self.create_stress_field(self.STRESS_BIRD_COUNTS[self.stress_step])
+        for bird in self.stress_birds:
+            bird.img = self.create_sprite("bird_0")
+            bird.img.set_pos(bird.x, int(bird.y))
+        self.resize_pipe_pool(self.stress_pipe_slots())
+        self.update_pipe_images()
+
+        gc.collect()
+        self.stress_step_start = current_time
+        self.stress_frames = 0
+        self.stress_frame_ms = 0
+        self.last_time = time.ticks_ms()
+
+    def update_stress(self, current_time, delta_ms, delta_time):
+        """Stress mode frame: simulate, move all widgets and measure"""
+        self.step_stress(self.stress_birds, delta_time)
+        for bird in self.stress_birds:
+            bird.img.set_y(int(bird.y))
+        self.update_pipe_images()
+
+        self.stress_frames += 1
+        self.stress_frame_ms += delta_ms
+        if time.ticks_diff(current_time, self.stress_step_start) >= self.STRESS_STEP_MS:
+            count = len(self.stress_birds)
+            frame_ms = self.stress_frame_ms // self.stress_frames
+            objects = self.count_objects(self.screen)
+            crashes = sum(bird.crashes for bird in self.stress_birds)
+            log.info("Stress: %d birds, %d ms/frame, %d objects", count, frame_ms, objects)
+            self.stress_results.append((count, frame_ms, self.last_fps, objects, crashes))
+            self.next_stress_step(current_time)
+
+    def stop_stress(self):
+        """Remove the stress field, report and go back to the start screen"""
+        for bird in self.stress_birds:
+            bird.img.delete()
+        self.stress_birds = None
+        self.pipes = []
+        self.resize_pipe_pool(self.MAX_PIPES)
+        self.update_ghost_switch()
+        self.update_pipe_images()
+
+        self.bird_y = self.SCREEN_HEIGHT / 2
+        self.bird_img.set_y(int(self.bird_y))
+        self.bird_img.remove_flag(lv.obj.FLAG.HIDDEN)
+        self.start_label.set_text(self.helptext)
+        self.start_label.remove_flag(lv.obj.FLAG.HIDDEN)
+        self.print_stress_report("on device", ("birds", "ms/frame", "fps", "objects", "crashes"), self.stress_results)
+
+    def count_objects(self, obj):
+        """Number of LVGL objects in the tree below (and including) obj"""
+        count = 1
+        for i in range(obj.get_child_count()):
+            count += self.count_objects(obj.get_child(i))
+        return count
+
+    def print_stress_report(self, title, columns, rows):
+        print(f"Quasi Bird stress report ({title}, pipes every {self.STRESS_PIPE_SPAWN_DISTANCE}px):")
+        print("".join(f"{column:>10}" for column in columns))
+        for row in rows:
+            print("".join(f"{value:>10}" for value in row))
 
     # Custom log callback to capture FPS
     def log_callback(self, level, log_str):
         # Convert log_str to string if it's a bytes object
         log_str = log_str.decode() if isinstance(log_str, bytes) else log_str
-        # Optional: Print for debugging
-        # print(f"Level: {level}, Log: {log_str}")
         # Log message format: "sysmon: 25 FPS (refr_cnt: 8 | redraw_cnt: 1), ..."
         if "sysmon:" in log_str and "FPS" in log_str:
             try:
                 # Extract FPS value (e.g., "25" from "sysmon: 25 FPS ...")
                 fps_part = log_str.split("FPS")[0].split("sysmon:")[1].strip()
                 self.last_fps = int(fps_part)
-                self.average_fps = self.moving_average(self.last_fps)
-                print(f"Current FPS: {self.last_fps} - Average 10 FPS: {self.average_fps}")
+                self.average_fps = self.fps_average.add(self.last_fps)
+                if _LOG_HOT:
+                    log.debug("FPS: %d - average: %d", self.last_fps, self.average_fps)
             except (IndexError, ValueError):
                 pass
+        else:
+            # Keep LVGL's own messages (trace, info, warn, error, user) without formatting them.
+            # Never echo them: this runs inside LVGL's render and log path, and the console is slow
+            log.log(min(level, Log.ERROR), log_str, None, False)
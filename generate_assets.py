@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 from PIL import Image, ImageDraw, ImageFont
+import argparse
+import json
 import os
+import sys
 
 COLORS = {
     "black": "#000000",
@@ -20,10 +23,6 @@ COLORS = {
     "amethyst_purple": "#9B59B6",
 }
 
-# Ensure output directories exist
-os.makedirs('res/mipmap-mdpi', exist_ok=True)
-os.makedirs('assets', exist_ok=True)
-
 # 1. Create app icon (64x64)
 # img = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
 # draw = ImageDraw.Draw(img)
@@ -48,68 +47,71 @@ os.makedirs('assets', exist_ok=True)
 # print("Icon saved: res/mipmap-mdpi/icon_64x64.png")
 
 # 2. Create bird sprite (32x32)
-bird = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
-draw = ImageDraw.Draw(bird)
+# Wing positions of the flap animation frames: resting, up, down
+WING_FLAP_OFFSETS = (0, -4, 2)
+
+def create_bird(wing_offset=0):
+    bird = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(bird)
 
-# Draw bird body
-draw.ellipse([(4, 6), (25, 27)], fill=COLORS["sun_yellow"], outline=COLORS["dark_orange"], width=1) # Original width 12 / 8 = 1.5, rounded to 1
+    # Draw bird body
+    draw.ellipse([(4, 6), (25, 27)], fill=COLORS["sun_yellow"], outline=COLORS["dark_orange"], width=1) # Original width 12 / 8 = 1.5, rounded to 1
 
-# Draw wing
-draw.ellipse([(7, 17), (20, 25)], fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1) # Original width 8 / 8 = 1
+    # Draw wing
+    draw.ellipse([(7, 17 + wing_offset), (20, 25 + wing_offset)], fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1) # Original width 8 / 8 = 1
 
-# Draw eye
-draw.ellipse([(16, 11), (21, 16)], fill=COLORS["white"], outline=COLORS["black"], width=1) # Original width 8 / 8 = 1
-draw.ellipse([(18, 13), (19, 14)], fill=COLORS["black"])
+    # Draw eye
+    draw.ellipse([(16, 11), (21, 16)], fill=COLORS["white"], outline=COLORS["black"], width=1) # Original width 8 / 8 = 1
+    draw.ellipse([(18, 13), (19, 14)], fill=COLORS["black"])
 
-# Draw beak
-beak = [(22, 17), (28, 17), (24, 20)] # Original width 4 / 8 = 0.5, rounded to 1
-draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
-beak = [(22, 17), (28, 17), (24, 14)] # Original width 4 / 8 = 0.5, rounded to 1
-draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
+    # Draw beak
+    beak = [(22, 17), (28, 17), (24, 20)] # Original width 4 / 8 = 0.5, rounded to 1
+    draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
+    beak = [(22, 17), (28, 17), (24, 14)] # Original width 4 / 8 = 0.5, rounded to 1
+    draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
 
-bird.save('assets/bird.png', 'PNG', optimize=True)
-print("Bird sprite saved: assets/bird.png")
+    return bird
 
 # 2b. Create fire bird sprite (32x32) - for beating highscore
-fire_bird = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
-draw = ImageDraw.Draw(fire_bird)
+def create_fire_bird(wing_offset=0):
+    fire_bird = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(fire_bird)
 
-# Draw bird body
-draw.ellipse([(4, 6), (25, 27)], fill=COLORS["dark_red"], outline=COLORS["dark_orange"], width=1)
+    # Draw bird body
+    draw.ellipse([(4, 6), (25, 27)], fill=COLORS["dark_red"], outline=COLORS["dark_orange"], width=1)
 
-# Draw wing
-draw.ellipse([(7, 17), (20, 25)], fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
+    # Draw wing
+    draw.ellipse([(7, 17 + wing_offset), (20, 25 + wing_offset)], fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
 
-# Draw eye
-draw.ellipse([(16, 11), (21, 16)], fill=COLORS["white"], outline=COLORS["black"], width=1)
-draw.ellipse([(18, 13), (19, 14)], fill=COLORS["black"])
+    # Draw eye
+    draw.ellipse([(16, 11), (21, 16)], fill=COLORS["white"], outline=COLORS["black"], width=1)
+    draw.ellipse([(18, 13), (19, 14)], fill=COLORS["black"])
 
-# Draw crown (3 points on top of head)
-crown_color = '#FFD700'  # Gold
+    # Draw crown (3 points on top of head)
+    crown_color = '#FFD700'  # Gold
 
-# Middle crown point (tallest)
-crown_mid = [(15, 2), (13, 8), (17, 8)]
-draw.polygon(crown_mid, fill=crown_color, outline='#FF8C00', width=1)
+    # Middle crown point (tallest)
+    crown_mid = [(15, 2), (13, 8), (17, 8)]
+    draw.polygon(crown_mid, fill=crown_color, outline='#FF8C00', width=1)
 
-# Left crown point
-crown_left = [(11, 4), (9, 8), (13, 8)]
-draw.polygon(crown_left, fill=crown_color, outline='#FF8C00', width=1)
+    # Left crown point
+    crown_left = [(11, 4), (9, 8), (13, 8)]
+    draw.polygon(crown_left, fill=crown_color, outline='#FF8C00', width=1)
 
-# Right crown point
-crown_right = [(19, 4), (17, 8), (21, 8)]
-draw.polygon(crown_right, fill=crown_color, outline='#FF8C00', width=1)
+    # Right crown point
+    crown_right = [(19, 4), (17, 8), (21, 8)]
+    draw.polygon(crown_right, fill=crown_color, outline='#FF8C00', width=1)
 
-# Draw beak
-beak = [(22, 17), (28, 17), (24, 20)]
-draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
-beak = [(22, 17), (28, 17), (24, 14)]
-draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
+    # Draw beak
+    beak = [(22, 17), (28, 17), (24, 20)]
+    draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
+    beak = [(22, 17), (28, 17), (24, 14)]
+    draw.polygon(beak, fill=COLORS["dark_orange"], outline=COLORS["red_orange"], width=1)
 
-fire_bird.save('assets/fire_bird.png', 'PNG', optimize=True)
-print("Fire bird sprite saved: assets/fire_bird.png")
+    return fire_bird
 
 # 2c. Create gray bird sprite (32x32)
-def create_gray_bird(size=(32, 32), filename='assets/gray_bird.png'):
+def create_gray_bird(size=(32, 32)):
     gray_bird = Image.new('RGBA', size, (0, 0, 0, 0))
     draw = ImageDraw.Draw(gray_bird)
 
@@ -131,32 +133,25 @@ def create_gray_bird(size=(32, 32), filename='assets/gray_bird.png'):
     beak = [(22, 17), (28, 17), (24, 14)]
     draw.polygon(beak, fill=COLORS["light_gray"], outline=COLORS["silver_gray"], width=1)
 
-    gray_bird.save(filename, 'PNG', optimize=True)
-    print(f"Gray bird sprite saved: {filename}")
-
-create_gray_bird()
+    return gray_bird
 
 # 3. Create pipe sprite (40x200)
-pipe = Image.new('RGBA', (40, 200), (0, 0, 0, 0))
-draw = ImageDraw.Draw(pipe)
-
-# Pipe body
-draw.rectangle([(4, 10), (36, 200)], fill='#5CB85C', outline='#449D44', width=2)
+def create_pipe():
+    pipe = Image.new('RGBA', (40, 200), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(pipe)
 
-# Pipe cap
-draw.rectangle([(0, 0), (40, 12)], fill='#5CB85C', outline='#449D44', width=2)
+    # Pipe body (the bottom edge lies outside the image, so every body row is the same
+    # and the top pipe can reuse the body with just a flipped cap)
+    draw.rectangle([(4, 10), (36, 202)], fill='#5CB85C', outline='#449D44', width=2)
 
-# Add some shading/detail
-draw.rectangle([(8, 12), (10, 200)], fill='#78C878')
-draw.rectangle([(30, 12), (32, 200)], fill='#449D44')
+    # Pipe cap
+    draw.rectangle([(0, 0), (40, 12)], fill='#5CB85C', outline='#449D44', width=2)
 
-pipe.save('assets/pipe.png', 'PNG', optimize=True)
-print("Pipe sprite saved: assets/pipe.png")
+    # Add some shading/detail
+    draw.rectangle([(8, 12), (10, 200)], fill='#78C878')
+    draw.rectangle([(30, 12), (32, 200)], fill='#449D44')
 
-# Create flipped pipe for top pipes
-pipe_flipped = pipe.transpose(Image.FLIP_TOP_BOTTOM)
-pipe_flipped.save('assets/pipe_top.png', 'PNG', optimize=True)
-print("Flipped pipe sprite saved: assets/pipe_top.png")
+    return pipe
 
 # 4. Create ground sprite (tileable pattern with adjustable parameters)
 def create_ground_tile(
@@ -201,18 +196,6 @@ def create_ground_tile(
 
     return ground
 
-# Generate ground with default settings (experiment by changing these!)
-ground = create_ground_tile(
-    width=20,           # Try: 10, 20, 40
-    height=40,
-    grass_height=6,
-    add_vertical_texture=True,
-    add_horizontal_texture=True
-)
-
-ground.save('assets/ground.png', 'PNG', optimize=True)
-print(f"Ground sprite saved: assets/ground.png ({ground.width}x{ground.height} tileable)")
-
 # 5. Create cloud sprite (for parallax scrolling)
 def create_cloud(width=50, height=25):
     """Create a simple cloud shape"""
@@ -231,10 +214,6 @@ def create_cloud(width=50, height=25):
 
     return cloud
 
-cloud = create_cloud(width=50, height=25)
-cloud.save('assets/cloud.png', 'PNG', optimize=True)
-print(f"Cloud sprite saved: assets/cloud.png ({cloud.width}x{cloud.height})")
-
 # # 6. Create background (320x240)
 # bg = Image.new('RGB', (320, 240), '#87CEEB')  # Sky blue
 # draw = ImageDraw.Draw(bg)
@@ -248,4 +227,243 @@ print(f"Cloud sprite saved: assets/cloud.png ({cloud.width}x{cloud.height})")
 # bg.save('assets/background.png', 'PNG', optimize=True)
 # print("Background saved: assets/background.png")
 
-print("\nAll assets generated successfully!")
+# 7. Export alpha bitmasks for pixel accurate collision detection
+def alpha_mask_rows(img, threshold=128):
+    """
+    Pack the alpha channel into one integer per row.
+
+    Bit x of a row is set when the pixel in column x is opaque enough to
+    collide with (alpha >= threshold), so the game can test two sprites
+    with a shift and an AND per overlapping row.
+    """
+    alpha = img.getchannel('A')
+    rows = []
+    for y in range(img.height):
+        row = 0
+        for x in range(img.width):
+            if alpha.getpixel((x, y)) >= threshold:
+                row |= 1 << x
+        rows.append(row)
+    return rows
+
+# 8. Pack all sprites into one atlas image
+def pack_atlas(sprites, width, padding=1):
+    """
+    Pack sprites into a single sheet using a skyline bottom-left packer.
+
+    Sprites are placed tallest first, each one at the lowest spot of the
+    skyline (the top edge of everything placed so far) it fits on.
+    Returns the sheet and a dict of name -> (x, y, width, height).
+    """
+    skyline = [(0, 0, width)]  # Segments (x, y, width) of the skyline, left to right
+    rects = {}
+    for name, img in sorted(sprites.items(), key=lambda item: (-item[1].height, item[0])):
+        w, h = img.width + padding, img.height + padding
+        best = None
+        for i, (x, _, _) in enumerate(skyline):
+            if x + w > width:
+                break
+            # The sprite rests on the highest segment below its footprint
+            y, covered, j = 0, 0, i
+            while covered < w:
+                y = max(y, skyline[j][1])
+                covered += skyline[j][2]
+                j += 1
+            if best is None or y < best[1]:
+                best = (x, y)
+        if best is None:
+            raise ValueError(f"Sprite {name} does not fit into an atlas {width}px wide")
+        x, y = best
+        rects[name] = (x, y, img.width, img.height)
+
+        # Raise the skyline under the new sprite
+        updated = [(x, y + h, w)]
+        for sx, sy, sw in skyline:
+            if sx < x:
+                updated.append((sx, sy, min(sw, x - sx)))
+            if sx + sw > x + w:
+                start = max(sx, x + w)
+                updated.append((start, sy, sx + sw - start))
+        updated.sort()
+        skyline = []
+        for segment in updated:
+            if skyline and skyline[-1][1] == segment[1]:
+                skyline[-1] = (skyline[-1][0], segment[1], skyline[-1][2] + segment[2])
+            else:
+                skyline.append(segment)
+
+    height = max(y + h for (x, y, w, h) in rects.values())
+    sheet = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    for name, (x, y, w, h) in rects.items():
+        sheet.paste(sprites[name], (x, y))
+    return sheet, rects
+
+def pack_smallest_atlas(sprites, widths=range(32, 257)):
+    """Try every sheet width and keep the one with the smallest area (every decoded pixel costs RAM)"""
+    best = None
+    for width in widths:
+        try:
+            sheet, rects = pack_atlas(sprites, width)
+        except ValueError:
+            continue
+        if best is None or sheet.width * sheet.height < best[0].width * best[0].height:
+            best = (sheet, rects)
+    return best
+
+# Rows of the pipe image taken by the cap, the rows below are all the same
+PIPE_CAP_HEIGHT = 13
+
+def create_pipe_top():
+    """The top pipe as the game shows it: the pipe body with the cap flipped to the bottom"""
+    return create_pipe().transpose(Image.FLIP_TOP_BOTTOM)
+
+def create_sprites():
+    """All sprites that go into the atlas, by manifest name"""
+    sprites = {}
+    for i, wing_offset in enumerate(WING_FLAP_OFFSETS):
+        sprites[f"bird_{i}"] = create_bird(wing_offset)
+        sprites[f"fire_bird_{i}"] = create_fire_bird(wing_offset)
+    sprites["gray_bird"] = create_gray_bird()
+    sprites["pipe"] = create_pipe()
+    # Top pipes show the body of "pipe" plus this pre-flipped cap, so they need neither a
+    # rotation transform at runtime nor a second 40x200 pipe (32 KiB decoded) in the atlas
+    sprites["pipe_top_cap"] = create_pipe_top().crop((0, 200 - PIPE_CAP_HEIGHT, 40, 200))
+    sprites["cloud"] = create_cloud(width=50, height=25)
+    return sprites
+
+# Flap animations, played once per flap and resting on the last frame. The two extra
+# wing frames per bird cost about 16 KiB of decoded atlas (ARGB8888), the price of the animation
+ANIMATIONS = {
+    "bird": ["bird_2", "bird_0", "bird_1", "bird_0"],
+    "fire_bird": ["fire_bird_2", "fire_bird_0", "fire_bird_1", "fire_bird_0"],
+}
+
+# Sprites the game needs collision masks for. The bird masks are the union of all
+# flap frames (the lowered wing of frame 2 reaches below the body), so collisions
+# never depend on which frame happens to be shown
+MASKS = {
+    "bird": ["bird_0", "bird_1", "bird_2"],
+    "fire_bird": ["fire_bird_0", "fire_bird_1", "fire_bird_2"],
+    "pipe": ["pipe"],
+    "pipe_top": ["pipe_top"],
+}
+
+def union_mask_rows(images):
+    """Mask rows opaque in any of the images (all of the same size)"""
+    rows = [0] * images[0].height
+    for img in images:
+        for y, row in enumerate(alpha_mask_rows(img)):
+            rows[y] |= row
+    return rows
+
+def create_masks(sprites):
+    """Width, height and rows of every collision mask in MASKS, by mask name"""
+    # Masks also cover sprites the game assembles from atlas parts
+    sources = dict(sprites, pipe_top=create_pipe_top())
+    return {
+        name: {
+            "width": sources[frames[0]].width,
+            "height": sources[frames[0]].height,
+            "rows": union_mask_rows([sources[frame] for frame in frames]),
+        }
+        for name, frames in MASKS.items()
+    }
+
+# 9. Decoded memory budget
+# Bytes per pixel once LVGL has decoded an image into its cache. The PNG
+# decoder produces ARGB8888; the others are what a converted (binary)
+# image would take. RGB888 and RGB565 drop the alpha channel entirely.
+DECODED_BYTES_PER_PIXEL = {
+    "ARGB8888": 4,
+    "RGB888": 3,
+    "RGB565A8": 3,  # RGB565 plane followed by an 8 bit alpha plane
+    "RGB565": 2,
+}
+
+# What LVGL's PNG decoder produces on the device, whatever format the budget is checked against
+DEVICE_COLOR_FORMAT = "ARGB8888"
+
+def decoded_size(img, color_format):
+    return img.width * img.height * DECODED_BYTES_PER_PIXEL[color_format]
+
+def print_memory_report(images, color_format, budget):
+    """
+    Print the decoded size of every image source per color format.
+
+    Every image object showing the same source shares one decoded copy, so
+    the eight pipes, the clouds and all birds cost one atlas together.
+    Returns the total in bytes for color_format.
+    """
+    print("\nDecoded image memory (one cached copy per source):")
+    print(f"{'image':<12}{'size':>10}" + "".join(f"{fmt:>11}" for fmt in DECODED_BYTES_PER_PIXEL))
+    totals = dict.fromkeys(DECODED_BYTES_PER_PIXEL, 0)
+    for name, img in images.items():
+        row = f"{name:<12}{f'{img.width}x{img.height}':>10}"
+        for fmt in DECODED_BYTES_PER_PIXEL:
+            size = decoded_size(img, fmt)
+            totals[fmt] += size
+            row += f"{size:>11}"
+        print(row)
+    print(f"{'total':<22}" + "".join(f"{totals[fmt]:>11}" for fmt in DECODED_BYTES_PER_PIXEL))
+    print(f"Budget: {totals[color_format]} of {budget} bytes as {color_format}")
+    return totals[color_format]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate the Quasi Bird sprites, atlas and manifest")
+    parser.add_argument(
+        "--budget-kb", type=int, default=int(os.environ.get("QUASIBIRD_IMAGE_BUDGET_KB", "128")),
+        help="fail if the decoded images need more than this many KiB (env QUASIBIRD_IMAGE_BUDGET_KB, default 128)")
+    parser.add_argument(
+        "--color-format", choices=sorted(DECODED_BYTES_PER_PIXEL), default="ARGB8888",
+        help="color format the budget is checked against (default ARGB8888, what the PNG decoder produces)")
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    # Ensure output directories exist
+    os.makedirs('res/mipmap-mdpi', exist_ok=True)
+    os.makedirs('assets', exist_ok=True)
+
+    sprites = create_sprites()
+
+    # The ground is drawn tiled, so it stays a separate image
+    # Generate ground with default settings (experiment by changing these!)
+    ground = create_ground_tile(
+        width=20,           # Try: 10, 20, 40
+        height=40,
+        grass_height=6,
+        add_vertical_texture=True,
+        add_horizontal_texture=True
+    )
+
+    atlas, rects = pack_smallest_atlas(sprites)
+
+    # Check the budget before writing anything, so an oversized build never reaches the assets folder
+    images = {"atlas.png": atlas, "ground.png": ground}
+    budget = args.budget_kb * 1024
+    if print_memory_report(images, args.color_format, budget) > budget:
+        sys.exit(f"Decoded images exceed the budget of {args.budget_kb} KiB, nothing was saved")
+    print()
+
+    ground.save('assets/ground.png', 'PNG', optimize=True)
+    print(f"Ground sprite saved: assets/ground.png ({ground.width}x{ground.height} tileable)")
+
+    atlas.save('assets/atlas.png', 'PNG', optimize=True)
+    print(f"Sprite atlas saved: assets/atlas.png ({atlas.width}x{atlas.height}, {len(rects)} sprites)")
+
+    manifest = {
+        "image": "atlas.png",
+        "size": [atlas.width, atlas.height],
+        "sprites": {name: list(rect) for name, rect in sorted(rects.items())},
+        "animations": ANIMATIONS,
+        "masks": create_masks(sprites),
+        # Decoded size of every image source as the device decodes it, for the memory overlay of the game
+        "decoded_format": DEVICE_COLOR_FORMAT,
+        "decoded": {name: decoded_size(img, DEVICE_COLOR_FORMAT) for name, img in images.items()},
+    }
+    with open('assets/atlas.json', 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+    print(f"Atlas manifest saved: assets/atlas.json ({', '.join(ANIMATIONS)} animations, {', '.join(MASKS)} masks)")
+
+    print("\nAll assets generated successfully!")
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Render Quasi Bird runs to PNG frames or a GIF, without a device or LVGL.
+
+The world is simulated with the same rules, constants and random generator
+as assets/quasibird.py, and drawn with the sprite functions of
+generate_assets.py. It either replays a recorded run (ghost_run.bin or
+ghost_best.bin from data/com.quasikili.quasibird/, the pipes come from its
+seed) or flies a headless run with a simple computer player.
+
+Sprites, ground strips and score frames are rendered once and only
+composited per frame, and frames where nothing moved are not redrawn, so
+rendering runs far faster than real time.
+
+    ./render_replay.py --ghost ghost_best.bin --gif best.gif
+    ./render_replay.py --seed 1234 --frames 600 --out frames/
+"""
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+import argparse
+import os
+import struct
+import sys
+import time
+
+from generate_assets import ANIMATIONS, create_ground_tile, create_masks, create_pipe_top, create_sprites
+
+# Mirrors the QuasiBird constants, keep in sync with assets/quasibird.py (tests/test_replay.py compares both)
+GRAVITY = 200
+FLAP_VELOCITY = -50
+BIRD_X = 60
+FLAP_FRAME_MS = 60
+BIRD_SIZE = 32
+PIPE_IMAGE_HEIGHT = 200
+PIPE_WIDTH = 40
+PIPE_SPEED = 100
+PIPE_SPAWN_DISTANCE = 200
+PIPE_GAP_SIZE = 80
+PIPE_MIN_Y = 20
+CLOUD_SPEED = 30
+CLOUD_START_POSITIONS = ((50, 30), (180, 60), (320, 40))
+GROUND_HEIGHT = 40
+GHOST_FLOAT_VELOCITY = -20
+GHOST_STEP = 4
+GHOST_OPA = 110
+HUD_BG_OPA = 180
+GHOST_MAGIC = b"QBG1"
+GHOST_HEADER = "<4sIh"  # magic, rng seed, start height; followed by one signed 8 bit delta per sample
+
+SKY_COLOR = "#87CEEB"
+FRAME_MS = 16  # The game's update timer
+GIF_MIN_EVERY = 2  # GIF delays count in 10ms and viewers play delays under 20ms at 100ms, so GIFs keep at most every 2nd frame
+GAME_OVER_FRAMES = 60  # Frames of the floating gray bird rendered after a crash
+
+
+class Rng:
+    """Same xorshift32 generator as the game, so a seed gives the same pipes"""
+
+    def __init__(self, state):
+        self.state = (state & 0xFFFFFFFF) or 1
+
+    def randint(self, a, b):
+        x = self.state
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.state = x
+        return a + x % (b - a + 1)
+
+
+def read_ghost(path):
+    """Read a recorded run, returns its seed and the height of every sample"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    header_size = struct.calcsize(GHOST_HEADER)
+    if len(data) < header_size:
+        raise ValueError(f"{path} is not a ghost run")
+    magic, seed, y = struct.unpack_from(GHOST_HEADER, data)
+    if magic != GHOST_MAGIC:
+        raise ValueError(f"{path} is not a ghost run")
+    heights = []
+    for delta in data[header_size:]:
+        y += delta - 256 if delta > 127 else delta
+        heights.append(y)
+    return seed, heights
+
+
+def simulate(seed, width, height, frames=None, heights=None, highscore=None):
+    """
+    Yield the world state of every frame of one run.
+
+    With heights (a recorded run) the bird follows the recording and the run
+    ends where the recording does; without, a computer player flaps towards
+    the middle of the next gap until it crashes (by the game's collision
+    masks) or frames are done.
+    """
+    masks = {name: Mask(mask["rows"]) for name, mask in create_masks(create_sprites()).items()} if heights is None else None
+    rng = Rng(seed)
+    pipe_max_y = height - 120
+    pipes = [[width + i * PIPE_SPAWN_DISTANCE, rng.randint(PIPE_MIN_Y, pipe_max_y), False] for i in range(3)]
+    clouds = [x for x, y in CLOUD_START_POSITIONS]
+    bird_y = height / 2
+    velocity = 0
+    ground_x = 0
+    score = 0
+    distance = 0
+    next_sample = 0
+    sample = 0
+    flap_time = -1000
+    fire = False
+    dt = FRAME_MS / 1000.0
+
+    frame = 0
+    while frames is None or frame < frames:
+        now = frame * FRAME_MS
+        if heights is None:
+            velocity += GRAVITY * dt
+            bird_y += velocity * dt
+        # The game animates before it sees the next tap, so a flap shows from the following frame on
+        bird_frame = min((now - flap_time) // FLAP_FRAME_MS, len(ANIMATIONS["bird"]) - 1)
+        flapped = False
+        if heights is None:
+            target = height / 2
+            for pipe in pipes:
+                if pipe[0] + PIPE_WIDTH > BIRD_X:
+                    target = pipe[1] + PIPE_GAP_SIZE / 2
+                    break
+            if velocity > 0 and bird_y + BIRD_SIZE / 2 > target:
+                velocity = FLAP_VELOCITY
+                flap_time = now
+                flapped = True
+
+        crashed = False
+        distance += PIPE_SPEED * dt
+        while distance >= next_sample:
+            next_sample += GHOST_STEP
+            if heights is not None:
+                if sample == len(heights):
+                    crashed = True  # The recorded run ends where it crashed
+                    break
+                new_y = heights[sample]
+                sample += 1
+                # Flaps are not recorded, start the animation where the bird turns upwards
+                if new_y < bird_y and velocity >= 0:
+                    flap_time = now
+                velocity = new_y - bird_y
+                bird_y = new_y
+
+        for i in range(len(clouds)):
+            clouds[i] -= CLOUD_SPEED * dt
+            if clouds[i] < -60:
+                clouds[i] = width + 20
+
+        for pipe in pipes:
+            pipe[0] -= PIPE_SPEED * dt
+            if not pipe[2] and pipe[0] + PIPE_WIDTH < BIRD_X:
+                pipe[2] = True
+                score += 1
+                if highscore is not None and score > highscore:
+                    fire = True
+        if pipes[0][0] < -PIPE_WIDTH:
+            pipes.pop(0)
+            pipes.append([pipes[-1][0] + PIPE_SPAWN_DISTANCE, rng.randint(PIPE_MIN_Y, pipe_max_y), False])
+
+        ground_x -= PIPE_SPEED * dt
+
+        if heights is None:
+            crashed = collides(bird_y, pipes, height, masks["fire_bird" if fire else "bird"], masks)
+        yield {
+            "bird_y": int(bird_y),
+            "bird_frame": bird_frame,
+            "flapped": flapped,  # The computer player tapped after this frame
+            "fire": fire,
+            "pipes": [(int(x), int(gap_y)) for x, gap_y, passed in pipes],
+            "clouds": [int(x) for x in clouds],
+            "ground_x": int(ground_x),
+            "score": score,
+            "crashed": crashed,
+        }
+        if crashed:
+            return
+        frame += 1
+
+
+class Mask:
+    """Collision rows of a sprite (from alpha_mask_rows) with their opaque bounding box, like the game's SpriteMask"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        opaque = [y for y, row in enumerate(rows) if row]
+        self.top, self.bottom = opaque[0], opaque[-1] + 1
+        combined = 0
+        for row in rows:
+            combined |= row
+        self.left = (combined & -combined).bit_length() - 1
+        self.right = combined.bit_length()
+
+    def hits(self, x, y, other, other_x, other_y):
+        """The game's test: bounding boxes first, then a shift and an AND per row both cover.
+        Python ints have no size limit, so the rows need no splitting into 30 bit chunks."""
+        if x + self.right <= other_x + other.left or other_x + other.right <= x + self.left:
+            return False
+        shift = other_x - x
+        for row_y in range(max(y + self.top, other_y + other.top), min(y + self.bottom, other_y + other.bottom)):
+            row = self.rows[row_y - y]
+            if (row >> shift if shift >= 0 else row << -shift) & other.rows[row_y - other_y]:
+                return True
+        return False
+
+
+def collides(bird_y, pipes, height, bird_mask, masks):
+    """The game's mask collision: the opaque rows against ground and ceiling, then the pixels against every pipe"""
+    bird_y = int(bird_y)
+    if bird_y + bird_mask.top <= 0 or bird_y + bird_mask.bottom > height - GROUND_HEIGHT:
+        return True
+    for x, gap_y, passed in pipes:
+        pipe_x = int(x)
+        if bird_mask.hits(BIRD_X, bird_y, masks["pipe_top"], pipe_x, int(gap_y - PIPE_IMAGE_HEIGHT)):
+            return True
+        if bird_mask.hits(BIRD_X, bird_y, masks["pipe"], pipe_x, int(gap_y + PIPE_GAP_SIZE)):
+            return True
+    return False
+
+
+def load_font(size):
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow before 10.1 has a single bitmap font
+        return ImageFont.load_default()
+
+
+class Renderer:
+    """Composites world states from pre-rendered layers onto one canvas"""
+
+    def __init__(self, width, height, highscore=0):
+        self.width = width
+        self.height = height
+        self.sky = ImageColor.getrgb(SKY_COLOR)
+        self.canvas = Image.new('RGB', (width, height), self.sky)
+        self.drawn = None  # What is on the canvas, to skip frames where nothing changed
+
+        sprites = create_sprites()
+        sprites["pipe_top"] = create_pipe_top()  # The game builds it from the pipe body and the flipped cap
+        self.sprites = sprites
+        self.animations = {name: [sprites[frame] for frame in frames] for name, frames in ANIMATIONS.items()}
+        alpha = sprites["gray_bird"].getchannel('A').point(lambda a: a * GHOST_OPA // 255)
+        self.race_ghost = sprites["gray_bird"].copy()
+        self.race_ghost.putalpha(alpha)
+
+        # One pre-cut ground strip per scroll offset, so scrolling is a lookup
+        tile = create_ground_tile()
+        strip = Image.new('RGBA', (width + tile.width, GROUND_HEIGHT))
+        for x in range(0, strip.width, tile.width):
+            strip.paste(tile, (x, 0))
+        self.tile_width = tile.width
+        self.grounds = [strip.crop((x, 0, x + width, GROUND_HEIGHT)) for x in range(tile.width)]
+
+        self.font = load_font(28)
+        self.small_font = load_font(20)
+        self.hud = {}
+        self.highscore_box = self.hud_box(f"Hi:{highscore}", "#FFD700", "#FFD700", self.small_font)
+
+    def hud_box(self, text, border, color, font):
+        """A score frame like the game's: translucent black, rounded, text centered"""
+        box = Image.new('RGBA', (60, 35))
+        draw = ImageDraw.Draw(box)
+        draw.rounded_rectangle((0, 0, 59, 34), radius=8, fill=(0, 0, 0, HUD_BG_OPA), outline=border, width=2)
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        draw.text(((60 - right - left) // 2, (35 - bottom - top) // 2), text, fill=color, font=font)
+        return box
+
+    def score_box(self, score):
+        if score not in self.hud:
+            self.hud[score] = self.hud_box(str(score), "#FFFFFF", "#FFFFFF", self.font)
+        return self.hud[score]
+
+    def layers(self, state, race_y=None, gray_y=None):
+        """Everything to draw for one state, back to front (in the order the game creates its widgets)"""
+        items = [(self.grounds[-state["ground_x"] % self.tile_width], 0, self.height - GROUND_HEIGHT)]
+        items += [(self.sprites["cloud"], x, y) for x, (_, y) in zip(state["clouds"], CLOUD_START_POSITIONS)]
+        if race_y is not None:
+            items.append((self.race_ghost, BIRD_X, race_y))
+        frames = self.animations["fire_bird" if state["fire"] else "bird"]
+        items.append((frames[state["bird_frame"]], BIRD_X, state["bird_y"]))
+        for x, gap_y in state["pipes"]:
+            items.append((self.sprites["pipe_top"], x, gap_y - PIPE_IMAGE_HEIGHT))
+            items.append((self.sprites["pipe"], x, gap_y + PIPE_GAP_SIZE))
+        items.append((self.score_box(state["score"]), self.width - 70, 10))
+        items.append((self.highscore_box, 10, 10))
+        if gray_y is not None:
+            items.append((self.sprites["gray_bird"], BIRD_X, gray_y))  # Moved to the foreground on a crash
+        return items
+
+    def draw(self, items):
+        """Bring the canvas up to date with items, returns False when it already was"""
+        drawn = [(id(img), x, y) for img, x, y in items]
+        if drawn == self.drawn:
+            return False
+        # Nearly everything scrolls every frame, so compositing the whole (small)
+        # frame is cheaper than working out and redrawing changed regions
+        self.canvas.paste(self.sky, (0, 0, self.width, self.height))
+        for img, x, y in items:
+            self.canvas.paste(img, (x, y), img)  # Uses the alpha channel as the mask
+        self.drawn = drawn
+        return True
+
+    def palette(self):
+        """A fixed GIF palette from all sprites over the sky, so frames are not quantized one by one"""
+        images = [self.grounds[0], self.race_ghost, self.score_box(0), self.highscore_box]
+        images += list(self.sprites.values())
+        sheet = Image.new('RGB', (sum(img.width for img in images), max(img.height for img in images)), self.sky)
+        x = 0
+        for img in images:
+            sheet.paste(img, (x, 0), img)
+            x += img.width
+        return sheet.quantize(255)
+
+
+def render(states, renderer, race=None, out_dir=None, gif=False, every=1):
+    """
+    Draw every state, write PNGs to out_dir and return the frame count and the frames kept for a GIF.
+
+    PNGs keep every Nth frame, the GIF every gif_every(every)th.
+    """
+    frames = []
+    palette = renderer.palette() if gif else None
+    gif_step = gif_every(every)
+    last = None
+    count = 0
+
+    def emit(items):
+        nonlocal count
+        changed = renderer.draw(items)
+        if out_dir and count % every == 0:
+            # Fast compression: these frames are for comparing, not for shipping
+            renderer.canvas.save(os.path.join(out_dir, f"frame_{count // every:05d}.png"), compress_level=1)
+        if gif and count % gif_step == 0:
+            if changed or not frames:
+                frames.append(renderer.canvas.quantize(palette=palette, dither=Image.Dither.NONE))
+            else:
+                frames.append(frames[-1])
+        count += 1
+
+    for i, state in enumerate(states):
+        race_y = race[i] if race is not None and i < len(race) else None
+        emit(renderer.layers(state, race_y))
+        last = state
+
+    if last is not None and last["crashed"]:
+        # The game leaves the world standing and lets a gray bird float up
+        gray_y = last["bird_y"]
+        for i in range(GAME_OVER_FRAMES):
+            gray_y += GHOST_FLOAT_VELOCITY * FRAME_MS / 1000.0
+            emit(renderer.layers(last, gray_y=int(gray_y)))
+    return count, frames
+
+
+def gif_every(every):
+    """How many game frames one GIF frame stands for"""
+    return max(every, GIF_MIN_EVERY)
+
+
+def gif_durations(count, every):
+    """
+    Delays of count GIF frames of every game frames each, in whole 10ms steps.
+
+    Each delay is rounded so the delays add up to the real play time, a
+    fixed rounded delay would make the GIF drift faster or slower.
+    """
+    ends = [round((i + 1) * every * FRAME_MS, -1) for i in range(count)]
+    return [end - start for start, end in zip([0] + ends, ends)]
+
+
+def race_heights(path, frames):
+    """Height of a recorded run at every frame, to draw it as the translucent racing ghost"""
+    seed, heights = read_ghost(path)
+    race = []
+    sample = 0
+    next_sample = 0
+    distance = 0
+    y = heights[0] if heights else None
+    for i in range(frames):
+        distance += PIPE_SPEED * FRAME_MS / 1000.0
+        while distance >= next_sample and y is not None:
+            next_sample += GHOST_STEP
+            # Like in the game, the ghost disappears where the recorded run crashed
+            y = heights[sample] if sample < len(heights) else None
+            sample += 1
+        race.append(y)
+    return seed, race
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render Quasi Bird runs to PNG frames or a GIF")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--ghost", help="replay a recorded run (ghost_run.bin or ghost_best.bin)")
+    source.add_argument("--seed", type=int, help="fly a headless run with the computer player on this pipe seed")
+    parser.add_argument("--race", help="also draw this recorded run as the translucent racing ghost")
+    parser.add_argument("--frames", type=int, help="stop after this many frames (headless runs default to 1800)")
+    parser.add_argument("--width", type=int, default=320)
+    parser.add_argument("--height", type=int, default=240)
+    parser.add_argument("--highscore", type=int, help="switch to the fire bird when the score beats this")
+    parser.add_argument("--out", help="write PNG frames to this directory")
+    parser.add_argument("--gif", help="write an animated GIF")
+    parser.add_argument("--every", type=int, default=1,
+                        help=f"keep every Nth frame (default 1, at least {GIF_MIN_EVERY} for the GIF)")
+    args = parser.parse_args()
+    if not args.out and not args.gif:
+        parser.error("give --out and/or --gif")
+    if args.every < 1:
+        parser.error("--every must be at least 1")
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    heights = None
+    race = None
+    try:
+        if args.ghost:
+            seed, heights = read_ghost(args.ghost)
+            frames = args.frames
+        else:
+            seed = args.seed
+            frames = args.frames or 1800
+        if args.race:
+            race_seed, race = race_heights(args.race, frames or len(heights) * GHOST_STEP * 1000 // (PIPE_SPEED * FRAME_MS) + 1)
+            if race_seed != seed:
+                print(f"Racing a run with seed {race_seed} on seed {seed}, its pipes won't match", file=sys.stderr)
+    except (OSError, ValueError) as e:
+        sys.exit(e)
+
+    renderer = Renderer(args.width, args.height, args.highscore or 0)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    states = simulate(seed, args.width, args.height, frames, heights, args.highscore)
+
+    start = time.perf_counter()
+    count, gif_frames = render(states, renderer, race, args.out, bool(args.gif), args.every)
+    if args.gif:
+        duration = gif_durations(len(gif_frames), gif_every(args.every))
+        # All frames share one palette already, Pillow's per frame palette optimization only costs time
+        gif_frames[0].save(args.gif, save_all=True, append_images=gif_frames[1:], duration=duration, loop=0, optimize=False)
+    elapsed = time.perf_counter() - start
+
+    game_seconds = count * FRAME_MS / 1000.0
+    print(f"Rendered {count} frames ({game_seconds:.1f}s of play) in {elapsed:.2f}s, "
+          f"{game_seconds / elapsed:.0f}x real time")
+    for path in (args.out, args.gif):
+        if path:
+            print(f"Saved: {path}")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Run the stress mode's headless sweep off device.
+
+Loads assets/quasibird.py on the LVGL and MicroPythonOS stand-ins of
+tests/stubs and times the widget-less stress simulation (the H key on the
+device) for growing bird counts. The times are CPython's on this machine:
+compare them with each other, before and after a change, not with the device.
+
+    ./stress_headless.py
+    ./stress_headless.py --counts 1 8 64 --frames 600
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, "tests", "stubs"))
+
+# MicroPython's tick functions, on the host clock
+if not hasattr(time, "ticks_us"):
+    time.ticks_ms = lambda: time.perf_counter_ns() // 1000000
+    time.ticks_us = lambda: time.perf_counter_ns() // 1000
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+
+
+def load_activity():
+    """Create the activity like MicroPythonOS would, from the app folder layout in the current directory"""
+    spec = importlib.util.spec_from_file_location("quasibird", os.path.join(ROOT, "assets", "quasibird.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    app = module.QuasiBird()
+    app.onCreate()
+    return app
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time the Quasi Bird stress simulation without a device")
+    parser.add_argument("--counts", type=int, nargs="+", help="bird counts to measure (default: the game's STRESS_BIRD_COUNTS)")
+    parser.add_argument("--frames", type=int, help="simulated frames per bird count (default: the game's STRESS_HEADLESS_FRAMES)")
+    args = parser.parse_args()
+    if args.counts and min(args.counts) < 1:
+        parser.error("--counts must be at least 1")
+    if args.frames is not None and args.frames < 1:
+        parser.error("--frames must be at least 1")
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as data_root:
+        # The game opens its assets and data relative to the working directory
+        app_dir = os.path.join(data_root, "apps", "com.quasikili.quasibird")
+        os.makedirs(app_dir)
+        os.symlink(os.path.join(ROOT, "assets"), os.path.join(app_dir, "assets"))
+        os.chdir(data_root)
+        app = load_activity()
+        app.run_stress_headless(args.counts, args.frames)
@@ -0,0 +1,81 @@
+"""Run the QuasiBird activity headless, on the LVGL and MicroPythonOS stand-ins in tests/stubs"""
+import gc
+import importlib.util
+import os
+import random
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubs"))
+
+import lvgl  # noqa: E402  (the stand-in from tests/stubs)
+import mpos  # noqa: E402
+
+
+class Game:
+    """The loaded module plus a fake clock that frames advance"""
+
+    def __init__(self, module):
+        self.module = module
+        self.lv = lvgl
+        self.prefs = mpos.PREFS
+        self.now = 0
+        self.heap = 0  # What gc.mem_alloc() reports, a drop looks like a collection
+
+    def launch(self):
+        app = self.module.QuasiBird()
+        app.onCreate()
+        app.onResume(app.screen)
+        return app
+
+    def close(self, app):
+        screen = app.screen
+        app.onPause(screen)
+        app.onDestroy(screen)
+        screen.delete()  # The framework owns and deletes the screen
+
+    def frames(self, count=1, app=None, flap_every=0):
+        """Advance the clock by count 16ms frames and run the LVGL timers"""
+        for i in range(count):
+            self.now += 16
+            if app and flap_every and i % flap_every == 0:
+                app.on_tap(None)
+            lvgl.run_timers()
+
+
+class KeyEvent:
+    def __init__(self, key):
+        self.key = key
+
+    def get_key(self):
+        return self.key
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """A freshly loaded quasibird module with its assets, data folder and clock in tmp_path"""
+    lvgl.reset()
+    mpos.reset()
+    app_dir = tmp_path / "apps" / "com.quasikili.quasibird"
+    app_dir.mkdir(parents=True)
+    (app_dir / "assets").symlink_to(os.path.join(ROOT, "assets"))
+    monkeypatch.chdir(tmp_path)
+
+    # MicroPython only APIs
+    threshold = [-1]
+    monkeypatch.setattr(gc, "threshold", lambda *value: threshold.__setitem__(0, value[0]) if value else threshold[0], raising=False)
+    random.seed(0)
+
+    spec = importlib.util.spec_from_file_location("quasibird", os.path.join(ROOT, "assets", "quasibird.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    game = Game(module)
+    monkeypatch.setattr(time, "ticks_ms", lambda: game.now, raising=False)
+    monkeypatch.setattr(time, "ticks_us", lambda: game.now * 1000, raising=False)
+    monkeypatch.setattr(time, "ticks_diff", lambda a, b: a - b, raising=False)
+    monkeypatch.setattr(time, "ticks_add", lambda a, b: a + b, raising=False)
+    monkeypatch.setattr(gc, "mem_alloc", lambda: game.heap, raising=False)
+    return game
@@ -0,0 +1,182 @@
+"""Minimal stand-in for the LVGL MicroPython binding, enough to run QuasiBird headless.
+
+Every object keeps its children and counts the calls made on it, so tests can
+check how many objects are alive and how much widget work a frame does.
+"""
+
+LIVE = set()  # All objects not deleted yet
+TIMERS = []
+
+
+def reset():
+    LIVE.clear()
+    TIMERS.clear()
+    _top_layer.children.clear()
+
+
+def widget_calls():
+    """Total number of calls made on live objects so far"""
+    return sum(obj.calls for obj in LIVE)
+
+
+class _Any:
+    """Stands in for enums, fonts and helper functions; equal when reached by the same name"""
+
+    def __init__(self, name="lv"):
+        self.name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Any(f"{self.name}.{name}")
+
+    def __call__(self, *args, **kwargs):
+        return _Any(f"{self.name}()")
+
+    def __or__(self, other):
+        return self
+
+    def __eq__(self, other):
+        return isinstance(other, _Any) and other.name == self.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+class obj:
+    FLAG = _Any("FLAG")
+
+    def __init__(self, parent=None, *args):
+        self.parent = parent
+        self.children = []
+        self.flags = set()
+        self.x = 0
+        self.y = 0
+        self.text = ""
+        self.calls = 0
+        self.deleted = False
+        if isinstance(parent, obj):
+            parent.children.append(self)
+        LIVE.add(self)
+
+    def delete(self):
+        for child in list(self.children):
+            child.delete()
+        if isinstance(self.parent, obj) and self in self.parent.children:
+            self.parent.children.remove(self)
+        LIVE.discard(self)
+        self.deleted = True
+
+    def clean(self):
+        for child in list(self.children):
+            child.delete()
+
+    def add_flag(self, flag):
+        self.calls += 1
+        self.flags.add(flag)
+
+    def remove_flag(self, flag):
+        self.calls += 1
+        self.flags.discard(flag)
+
+    def has_flag(self, flag):
+        return flag in self.flags
+
+    def set_pos(self, x, y):
+        self.calls += 1
+        self.x = x
+        self.y = y
+
+    def set_x(self, x):
+        self.calls += 1
+        self.x = x
+
+    def set_y(self, y):
+        self.calls += 1
+        self.y = y
+
+    def set_text(self, text):
+        self.calls += 1
+        self.text = text
+
+    def get_child_count(self):
+        return len(self.children)
+
+    def get_child(self, i):
+        return self.children[i]
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            assert not self.deleted, f"{name}() called on a deleted object"
+            self.calls += 1
+        return method
+
+
+class image(obj):
+    ALIGN = _Any("ALIGN")
+
+
+class label(obj):
+    pass
+
+
+class button(obj):
+    pass
+
+
+class Timer:
+    def __init__(self, callback, period):
+        self.callback = callback
+        self.deleted = False
+
+    def delete(self):
+        # Like LVGL, a deleted timer drops its callback, so it keeps nothing alive
+        self.deleted = True
+        TIMERS.remove(self)
+
+    def set_period(self, period):
+        pass
+
+
+def timer_create(callback, period, user_data):
+    timer = Timer(callback, period)
+    TIMERS.append(timer)
+    return timer
+
+
+def run_timers():
+    for timer in list(TIMERS):
+        if not timer.deleted:
+            timer.callback(timer)
+
+
+_top_layer = obj()
+LIVE.discard(_top_layer)
+
+
+def layer_top():
+    return _top_layer
+
+
+def group_get_default():
+    return None
+
+
+def log_register_print_cb(callback):
+    pass
+
+
+def color_hex(value):
+    return value
+
+
+class KEY:
+    ENTER = 10
+    UP = 17
+
+
+def __getattr__(name):
+    return _Any(name)
@@ -0,0 +1,77 @@
+"""Minimal stand-in for the MicroPythonOS APIs QuasiBird uses"""
+
+PREFS = {}  # Preference name -> dict of stored values
+
+
+def reset():
+    PREFS.clear()
+
+
+class Activity:
+    def setContentView(self, screen):
+        self.content = screen
+
+
+class DisplayMetrics:
+    @staticmethod
+    def width():
+        return 320
+
+    @staticmethod
+    def height():
+        return 240
+
+
+class InputManager:
+    @staticmethod
+    def pointer_xy():
+        return (100, 100)
+
+    @staticmethod
+    def has_indev_type(indev_type):
+        return False
+
+    @staticmethod
+    def emulate_focus_obj(group, obj):
+        pass
+
+
+class _Editor:
+    def __init__(self, values):
+        self.values = values
+
+    def put_int(self, key, value):
+        self.values[key] = value
+        return self
+
+    def put_string(self, key, value):
+        self.values[key] = value
+        return self
+
+    def put_bool(self, key, value):
+        self.values[key] = value
+        return self
+
+    def remove(self, key):
+        self.values.pop(key, None)
+        return self
+
+    def commit(self):
+        pass
+
+
+class SharedPreferences:
+    def __init__(self, name):
+        self.values = PREFS.setdefault(name, {})
+
+    def get_int(self, key, default=0):
+        return self.values.get(key, default)
+
+    def get_string(self, key, default=None):
+        return self.values.get(key, default)
+
+    def get_bool(self, key, default=False):
+        return self.values.get(key, default)
+
+    def edit(self):
+        return _Editor(self.values)
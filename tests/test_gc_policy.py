@@ -0,0 +1,44 @@
+"""The collector threshold is low between runs and the system's own in flight and outside the game"""
+import gc
+
+
+def test_threshold_follows_the_game(game):
+    gc.threshold(32768)  # A port with a threshold of its own, on stock MicroPython it is -1
+    system_threshold = gc.threshold()
+    app = game.launch()
+    assert gc.threshold() == app.gc_policy.idle_threshold  # Menu
+
+    app.on_tap(None)
+    assert gc.threshold() == system_threshold  # Flying
+    assert app.gc_policy.recent()  # The start collection was recorded
+
+    while not app.game_over:
+        game.frames(1)
+    assert gc.threshold() == app.gc_policy.idle_threshold  # Game over lockout
+
+    game.close(app)
+    assert gc.threshold() == system_threshold
+
+
+def test_collections_in_flight_are_measured_apart_from_safe_points(game):
+    app = game.launch()
+    app.on_tap(None)
+    policy = app.gc_policy
+    assert policy.run_max == 0 and policy.run_collections == 0
+    assert policy.recent()  # The safe point collection at the start
+
+    game.heap = 20000
+    game.frames(5, app, flap_every=3)  # The heap grows, no collection
+    assert policy.run_collections == 0
+
+    game.heap = 8000
+    game.now += 60  # The collector ran in a slow frame
+    game.frames(1)
+    game.frames(5, app, flap_every=3)
+    assert policy.run_collections == 1
+    assert policy.run_max == 76
+
+    app.fps_label.text = ""
+    app.show_fps = 3
+    game.frames(1)
+    assert app.fps_label.text == "GC:76ms"
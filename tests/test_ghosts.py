@@ -0,0 +1,129 @@
+"""Ghost runs: recorded in chunks, played back exactly, and kept only when they beat the best run"""
+import os
+import random
+
+from conftest import KeyEvent
+
+
+def record(module, path, heights, chunk=16):
+    recorder = module.GhostRecorder(path, 1234, heights[0], chunk)
+    for y in heights:
+        recorder.add(y)
+    recorder.close()
+    return recorder
+
+
+def play(module, path, chunk=16):
+    player = module.GhostPlayer(path, chunk)
+    heights = []
+    while player.next():
+        heights.append(player.y)
+    player.close()
+    return player.seed, heights
+
+
+def test_round_trip_over_several_chunks(game, tmp_path):
+    path = str(tmp_path / "run.bin")
+    rng = random.Random(3)
+    heights = [100]
+    for i in range(1000):
+        heights.append(max(0, min(200, heights[-1] + rng.randint(-6, 6))))
+    record(game.module, path, heights, game.module.QuasiBird.GHOST_CHUNK)
+    assert len(heights) > 3 * game.module.QuasiBird.GHOST_CHUNK
+    assert play(game.module, path, game.module.QuasiBird.GHOST_CHUNK) == (1234, heights)
+
+
+def test_big_jumps_are_clamped_and_caught_up(game, tmp_path):
+    path = str(tmp_path / "run.bin")
+    heights = [10, 10, 300, 300, 300, -100, -100, -100, -100]
+    recorder = record(game.module, path, heights)
+    seed, played = play(game.module, path)
+    assert played == [10, 10, 137, 264, 300, 173, 46, -81, -100]
+    assert recorder.y == heights[-1]
+
+
+def test_not_a_ghost_run(game, tmp_path):
+    path = tmp_path / "run.bin"
+    path.write_bytes(b"nope")
+    try:
+        game.module.GhostPlayer(str(path), 16)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("read a file without the ghost header")
+
+
+def fly_until_crash(game, app):
+    app.on_tap(None)
+    while not app.game_over:
+        game.frames(1)
+
+
+def best_run(app):
+    return f"{app.DATA_PATH}ghost_best.bin"
+
+
+def test_ghost_disappears_where_the_best_run_ended(game):
+    app = game.launch()
+    app.make_data_dir()
+    record(game.module, best_run(app), [120] * 10)
+    app.ghost_score = 3
+    app.ghost_race = True
+
+    app.on_tap(None)
+    assert not app.race_ghost_img.has_flag(game.lv.obj.FLAG.HIDDEN)
+    # 10 samples of GHOST_STEP pixels at PIPE_SPEED take 400ms, well before the bird crashes
+    game.frames(20)
+    assert app.ghost_player is not None
+    assert app.race_ghost_img.y == 120
+    game.frames(10)
+    assert app.ghost_player is None
+    assert app.race_ghost_img.has_flag(game.lv.obj.FLAG.HIDDEN)
+
+
+def test_best_run_only_replaced_when_beaten(game):
+    app = game.launch()
+    app.make_data_dir()
+    record(game.module, best_run(app), [120] * 10)
+    with open(best_run(app), "rb") as f:
+        best = f.read()
+
+    app.ghost_score = 5
+    fly_until_crash(game, app)  # Without flapping: score 0
+    with open(best_run(app), "rb") as f:
+        assert f.read() == best
+    assert not os.path.exists(f"{app.DATA_PATH}ghost_run.bin")
+    assert game.prefs["com.quasikili.quasibird"].get("ghost_score") is None
+
+    app.ghost_score = 0
+    game.now += 2000  # Past the game over lockout
+    app.on_tap(None)  # Restart
+    app.score = 1  # Pretend a pipe was passed
+    while not app.game_over:
+        game.frames(1)
+    with open(best_run(app), "rb") as f:
+        assert f.read() != best
+    assert app.ghost_score == 1
+    assert game.prefs["com.quasikili.quasibird"]["ghost_score"] == 1
+
+
+def test_race_is_off_by_default_and_switches_by_touch(game):
+    app = game.launch()
+    assert not app.ghost_race
+    assert not app.ghost_bg.has_flag(game.lv.obj.FLAG.HIDDEN)
+    assert app.ghost_label.text == "Ghost:off"
+
+    app.on_ghost_tap(None)
+    assert app.ghost_race
+    assert app.ghost_label.text == "Ghost:on"
+    assert game.prefs["com.quasikili.quasibird"]["ghost_race"] == 1
+
+    app.on_tap(None)
+    assert app.ghost_bg.has_flag(game.lv.obj.FLAG.HIDDEN)  # Not in flight
+    while not app.game_over:
+        game.frames(1)
+    assert not app.ghost_bg.has_flag(game.lv.obj.FLAG.HIDDEN)
+
+    app.on_key(KeyEvent(ord("X")))
+    assert not app.ghost_race
+    assert app.ghost_label.text == "Ghost:off"
@@ -0,0 +1,20 @@
+"""LVGL's log lines go into the ring buffer only, the console is too slow for LVGL's render path"""
+
+
+def test_lvgl_lines_are_buffered_not_printed(game, capsys):
+    app = game.launch()
+    capsys.readouterr()
+    app.log_callback(3, b"[Error] lv_draw: out of memory")
+    app.log_callback(2, "[Warn] lv_image: cache full")
+    app.log_callback(1, "sysmon: 25 FPS (refr_cnt: 8 | redraw_cnt: 1)")
+    assert capsys.readouterr().out == ""
+    assert app.last_fps == 25
+
+    game.module.log.dump()
+    dumped = capsys.readouterr().out
+    assert "lv_draw: out of memory" in dumped
+    assert "lv_image: cache full" in dumped
+
+    # The game's own warnings are still echoed
+    game.module.log.warn("stall: %d ms frame", 250)
+    assert "stall: 250 ms frame" in capsys.readouterr().out
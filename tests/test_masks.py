@@ -0,0 +1,70 @@
+"""Pixel accurate collision from the atlas masks, computed with small ints only"""
+import json
+import os
+import random
+
+from conftest import ROOT
+
+with open(os.path.join(ROOT, "assets", "atlas.json")) as f:
+    MASKS = json.load(f)["masks"]
+
+
+def opaque(mask, x, y):
+    return 0 <= y < len(mask["rows"]) and 0 <= x < mask["width"] and mask["rows"][y] >> x & 1
+
+
+def brute_force_hits(a, ax, ay, b, bx, by):
+    for y in range(len(a["rows"])):
+        for x in range(a["width"]):
+            if opaque(a, x, y) and opaque(b, ax + x - bx, ay + y - by):
+                return True
+    return False
+
+
+def test_hits_matches_pixel_overlap(game):
+    SpriteMask = game.module.SpriteMask
+    rng = random.Random(7)
+    for bird in ("bird", "fire_bird"):
+        for pipe in ("pipe", "pipe_top"):
+            a, b = MASKS[bird], MASKS[pipe]
+            bird_mask = SpriteMask(a["rows"], a["width"])
+            pipe_mask = SpriteMask(b["rows"], b["width"])
+            for i in range(400):
+                bx, by = rng.randint(-45, 45), rng.randint(-40, len(b["rows"]) + 10)
+                assert bird_mask.hits(0, 0, pipe_mask, bx, by) == brute_force_hits(a, 0, 0, b, bx, by), (bird, pipe, bx, by)
+
+
+def test_mask_values_fit_small_ints(game):
+    SpriteMask = game.module.SpriteMask
+    assert max(row.bit_length() for row in MASKS["pipe"]["rows"]) > 30  # The reason for the chunks
+    for mask in MASKS.values():
+        sprite_mask = SpriteMask(mask["rows"], mask["width"])
+        for first, rows in sprite_mask.chunks:
+            assert all(row < 1 << 30 for row in rows)
+
+
+def test_incomplete_masks_fall_back_to_boxes(game):
+    app = game.launch()
+    masks = dict(MASKS)
+    del masks["pipe_top"]
+    app.load_masks(masks)
+    assert app.bird_mask is None and app.fire_bird_mask is None and app.pipe_mask is None
+    app.on_tap(None)
+    app.is_fire_bird = True
+    assert app.check_collision() in (True, False)
+
+
+def test_render_replay_collides_like_the_game(game, monkeypatch):
+    monkeypatch.syspath_prepend(ROOT)
+    import render_replay
+
+    app = game.launch()
+    masks = {name: render_replay.Mask(mask["rows"]) for name, mask in MASKS.items()}
+    rng = random.Random(11)
+    for i in range(400):
+        bird_y = rng.uniform(-10, app.SCREEN_HEIGHT)
+        pipes = [[app.BIRD_X + rng.randint(-60, 60), rng.randint(app.PIPE_MIN_Y, app.PIPE_MAX_Y), False]]
+        app.pipes = [game.module.Pipe(x, gap_y, render_replay.PIPE_GAP_SIZE) for x, gap_y, passed in pipes]
+        for bird in ("bird", "fire_bird"):
+            expected = app.bird_collides(app.BIRD_X, bird_y, getattr(app, f"{bird}_mask"))
+            assert render_replay.collides(bird_y, pipes, app.SCREEN_HEIGHT, masks[bird], masks) == expected
@@ -0,0 +1,35 @@
+"""The overlay's costly readouts stay off the per-frame path"""
+import json
+import os
+
+from conftest import ROOT
+
+
+def test_object_count_refreshes_about_once_a_second(game):
+    app = game.launch()
+    walks = []
+    count_objects = app.count_objects
+    app.count_objects = lambda obj: (obj is app.screen and walks.append(obj)) or count_objects(obj)
+    for i in range(6):
+        app.toggle_fps()
+    assert app.show_fps == 6
+
+    game.frames(1)
+    assert len(walks) == 1  # Right away when switched on
+    assert app.fps_label.text.startswith("OBJ:")
+    game.frames(app.OBJECT_COUNT_MS // 16 - 1)
+    assert len(walks) == 1
+    game.frames(2)
+    assert len(walks) == 2
+
+
+def test_image_memory_is_marked_as_estimate(game):
+    app = game.launch()
+    for i in range(5):
+        app.toggle_fps()
+    game.frames(1)
+    assert app.fps_label.text == f"~IMG:{(app.image_cache_bytes + 512) // 1024}K"
+    # atlas.png and the 20x40 ground.png, as ARGB8888 whatever format the budget was checked in
+    with open(os.path.join(ROOT, "assets", "atlas.json")) as f:
+        width, height = json.load(f)["size"]
+    assert app.image_cache_bytes == (width * height + 20 * 40) * 4
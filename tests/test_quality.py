@@ -0,0 +1,84 @@
+"""The quality governor sheds visuals on slow frames and brings them back without flickering"""
+
+
+def settled(governor, frame_ms):
+    """Start from a smoothed frame time of frame_ms, as after a while at that speed"""
+    governor.frame_ms_x8 = frame_ms * 8
+    return governor
+
+
+def feed(governor, frame_ms, count):
+    """Feed count frames of frame_ms, returns the (1 based) frames at which the level changed"""
+    return [i + 1 for i in range(count) if governor.update(frame_ms)]
+
+
+def test_steps_up_after_hold_frames(game):
+    governor = settled(game.module.QualityGovernor(4, hold_frames=30), 40)
+    assert feed(governor, 40, 29) == []
+    assert feed(governor, 40, 1) == [1]
+    assert governor.level == 1
+    assert feed(governor, 40, 200) == [30, 60, 90]
+    assert governor.level == 4  # And no further
+
+
+def test_restores_after_restore_frames(game):
+    governor = settled(game.module.QualityGovernor(4, restore_frames=120), 40)
+    feed(governor, 40, 60)
+    assert governor.level == 2
+    settled(governor, 10)
+    assert feed(governor, 10, 240) == [120, 240]
+    assert governor.level == 0
+
+
+def test_frames_between_thresholds_hold_the_level(game):
+    governor = settled(game.module.QualityGovernor(4), 40)
+    feed(governor, 40, 30)
+    settled(governor, 20)  # Between restore_ms and degrade_ms
+    assert feed(governor, 20, 1000) == []
+    assert governor.level == 1
+
+
+def test_stalls_are_ignored(game):
+    governor = settled(game.module.QualityGovernor(4), 16)
+    assert feed(governor, 500, 100) == []
+    assert governor.frame_ms_x8 == 16 * 8
+    assert governor.over == 0
+
+
+def test_restore_hold_doubles_when_the_restored_level_is_too_slow(game):
+    governor = settled(game.module.QualityGovernor(4, restore_frames=120), 40)
+    feed(governor, 40, 30)
+    settled(governor, 10)
+    assert feed(governor, 10, 120) == [120]
+
+    # Too slow again right after restoring: back up, and wait twice as long next time
+    settled(governor, 40)
+    assert feed(governor, 40, 30) == [30]
+    assert governor.restore_frames == 240
+    settled(governor, 10)
+    assert feed(governor, 10, 240) == [240]
+
+    # A level that holds for longer than the restore hold does not double it
+    settled(governor, 16)
+    feed(governor, 16, 240)
+    settled(governor, 40)
+    feed(governor, 40, 30)
+    assert governor.restore_frames == 240
+
+
+def test_top_level_sheds_the_racing_ghost(game):
+    app = game.launch()
+    app.ghost_player = game.module.GhostPlayer.__new__(game.module.GhostPlayer)
+    app.ghost_player.y = 50
+    app.apply_quality()
+    assert not app.race_ghost_img.has_flag(game.lv.obj.FLAG.HIDDEN)
+
+    app.quality.level = app.QUALITY_NO_GHOSTS
+    app.apply_quality()
+    assert app.race_ghost_img.has_flag(game.lv.obj.FLAG.HIDDEN)
+
+    app.quality.level = app.QUALITY_NO_GHOSTS - 1
+    app.ghost_player.y = 70
+    app.apply_quality()
+    assert not app.race_ghost_img.has_flag(game.lv.obj.FLAG.HIDDEN)
+    assert app.race_ghost_img.y == 70  # Back where the recorded run is now
@@ -0,0 +1,52 @@
+"""Launching the activity again and again must not leak widgets, memory or grow the per-frame work"""
+import gc
+import random
+
+CYCLES = 100
+WARM_UP = 50  # Cycles until the log ring buffer and other preallocated state are full
+
+
+def test_relaunch_keeps_objects_and_frame_work_constant(game):
+    # Race no ghost, so every cycle plays exactly the same run
+    game.prefs["com.quasikili.quasibird"] = {"ghost_race": 0}
+    alive = []
+    frame_work = []
+    left_over = []
+    heap = []
+    for cycle in range(CYCLES):
+        random.seed(0)
+        app = game.launch()
+        app.on_tap(None)  # Start
+        game.frames(30, app, flap_every=12)
+        alive.append(len(game.lv.LIVE))
+        before = game.lv.widget_calls()
+        game.frames(1)
+        frame_work.append(game.lv.widget_calls() - before)
+        game.frames(200, app, flap_every=12)
+        game.close(app)
+        del app
+        left_over.append(len(game.lv.LIVE))
+        gc.collect()
+        heap.append(len(gc.get_objects()))
+
+    assert alive == [alive[0]] * CYCLES
+    assert frame_work == [frame_work[0]] * CYCLES
+    assert frame_work[0] > 0
+    assert left_over == [0] * CYCLES
+    # Python side leaks (growing lists, ghost files, log arguments) show up as more live objects
+    assert heap[WARM_UP:] == [heap[WARM_UP]] * (CYCLES - WARM_UP)
+    assert not any(not timer.deleted for timer in game.lv.TIMERS)
+
+
+def test_destroy_does_not_snapshot_again(game):
+    app = game.launch()
+    app.on_tap(None)
+    game.frames(10, app, flap_every=5)
+    persisted = []
+    app.persist_snapshot = persisted.append
+
+    screen = app.screen
+    app.onPause(screen)
+    assert len(persisted) == 1
+    app.onDestroy(screen)
+    assert len(persisted) == 1
@@ -0,0 +1,49 @@
+"""render_replay.py simulates the game's world frame by frame, checked against the real activity"""
+import random
+
+import pytest
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def render_replay(monkeypatch):
+    monkeypatch.syspath_prepend(ROOT)
+    import render_replay
+    return render_replay
+
+
+def game_state(app, flapped):
+    """The activity's world in the shape of a simulate() state"""
+    return {
+        "bird_y": int(app.bird_y),
+        "bird_frame": app.bird_frame,
+        "fire": app.is_fire_bird,
+        "pipes": [(int(pipe.x), int(pipe.gap_y)) for pipe in app.pipes],
+        "clouds": [int(x) for x in app.cloud_positions],
+        "ground_x": int(app.ground_x),
+        "score": app.score,
+        "crashed": app.game_over,
+        "flapped": flapped,
+    }
+
+
+@pytest.mark.parametrize("seed", [1, 1234, 987654321])
+def test_simulate_matches_the_game(game, render_replay, monkeypatch, seed):
+    game.now = 100000  # A device clock is far from 0, so the bird starts on its resting frame
+    app = game.launch()
+    assert (app.SCREEN_WIDTH, app.SCREEN_HEIGHT) == (320, 240)
+    monkeypatch.setattr(random, "getrandbits", lambda bits: seed)
+    states = list(render_replay.simulate(seed, app.SCREEN_WIDTH, app.SCREEN_HEIGHT, 3000, highscore=app.highscore))
+    assert len(states) > 200  # The computer player gets past a few pipes
+    assert states[-1]["score"] > 2
+
+    app.on_tap(None)
+    for i, state in enumerate(states):
+        highscore = app.highscore
+        game.frames(1)
+        if state["crashed"] and state["score"] > highscore:
+            app.score = state["score"]  # The game moves a beaten score into the high score on the crash
+        assert game_state(app, state["flapped"]) == state, f"frame {i}"
+        if state["flapped"]:
+            app.on_tap(None)
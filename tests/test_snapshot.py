@@ -0,0 +1,53 @@
+"""A paused game comes back exactly as it was, and only when the player is ready"""
+import binascii
+
+import pytest
+
+from conftest import KeyEvent
+
+
+def start_and_pause(game):
+    app = game.launch()
+    app.on_tap(None)
+    game.frames(40, app, flap_every=12)
+    screen = app.screen
+    app.onPause(screen)
+    return app, screen
+
+
+def test_resume_restores_the_game_and_waits(game):
+    app, screen = start_and_pause(game)
+    bird_y, pipes = app.bird_y, [value for pipe in app.pipes for value in (pipe.x, pipe.gap_y)]
+    app.onResume(screen)
+    assert app.resume_pending and app.game_paused
+    # Positions are stored as 32 bit floats
+    assert app.bird_y == pytest.approx(bird_y, abs=0.01)
+    assert [value for pipe in app.pipes for value in (pipe.x, pipe.gap_y)] == pytest.approx(pipes, abs=0.01)
+
+    app.on_tap(None)
+    assert not app.resume_pending and not app.game_paused
+
+
+def test_closing_the_popup_keeps_a_resumed_game_waiting(game):
+    app, screen = start_and_pause(game)
+    app.onResume(screen)
+    app.on_key(KeyEvent(ord("Y")))  # High score popup
+    app.on_delete_no(None)
+    assert app.resume_pending and app.game_paused
+
+    bird_y = app.bird_y
+    game.frames(10)
+    assert app.bird_y == bird_y  # Still holding for the tap
+
+
+def test_truncated_snapshot_leaves_the_game_alone(game):
+    app, screen = start_and_pause(game)
+    saved = game.prefs["com.quasikili.quasibird"]["snapshot"]
+    game.close(app)
+    truncated = binascii.unhexlify(saved)[:-6]  # Cut into the cloud records
+    game.prefs["com.quasikili.quasibird"]["snapshot"] = binascii.hexlify(truncated).decode()
+
+    app = game.launch()
+    assert not app.game_started
+    assert not app.game_paused
+    assert app.pipes == []
@@ -0,0 +1,64 @@
+"""The stress field keeps its density and the H sweep runs in slices between LVGL frames, or off device"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT, KeyEvent
+
+
+def test_field_stays_dense(game):
+    app = game.launch()
+    birds, app.pipes = app.create_stress_field(4)
+    counts = set()
+    for frame in range(2000):
+        known = set(map(id, app.pipes))
+        app.step_stress(birds, 0.016)
+        if frame >= 500:  # Once the starting pipes are gone, the count must not thin out
+            counts.add(len(app.pipes))
+        # New pipes appear beyond the right edge, never on screen
+        assert all(pipe.x >= app.SCREEN_WIDTH for pipe in app.pipes if id(pipe) not in known)
+        assert app.pipes[-1].x >= app.SCREEN_WIDTH
+        gaps = [b.x - a.x for a, b in zip(app.pipes, app.pipes[1:])]
+        assert gaps == pytest.approx([app.STRESS_PIPE_SPAWN_DISTANCE] * len(gaps))
+    assert min(counts) >= 5
+    assert max(counts) <= app.stress_pipe_slots()
+
+
+def test_headless_sweep_runs_a_slice_per_frame(game):
+    app = game.launch()
+    app.on_key(KeyEvent(ord("H")))
+    assert app.stress_sweep is not None
+    slices = len(app.STRESS_BIRD_COUNTS) * -(-app.STRESS_HEADLESS_FRAMES // app.STRESS_HEADLESS_SLICE)
+    game.frames(slices)
+    assert app.stress_sweep is not None
+    assert app.pipes == []  # The field is only lent to self.pipes during a slice
+    game.frames(1)
+    assert app.stress_sweep is None
+    assert app.start_label.text == app.helptext
+
+
+def test_no_game_starts_during_the_headless_sweep(game):
+    app = game.launch()
+    app.on_key(KeyEvent(ord("H")))
+    game.frames(3)
+    app.on_tap(None)
+    app.on_key(KeyEvent(ord("A")))
+    app.on_key(KeyEvent(ord("S")))
+    assert not app.game_started
+    assert app.stress_birds is None
+    assert app.stress_sweep is not None
+
+    while app.stress_sweep is not None:
+        game.frames(1)
+    app.on_tap(None)
+    assert app.game_started
+
+
+def test_sweep_runs_off_device():
+    result = subprocess.run([sys.executable, os.path.join(ROOT, "stress_headless.py"), "--counts", "1", "4", "--frames", "20"],
+                            capture_output=True, text=True, check=True)
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith("Quasi Bird stress report (headless")
+    assert [int(line.split()[0]) for line in lines[2:]] == [1, 4]